@@ -1,9 +1,22 @@
 __all__ = [
     "BaseExceptionGroup",
+    "ExceptionCollector",
     "ExceptionGroup",
+    "ExceptionStatistics",
+    "batch_split",
     "catch",
+    "contains_leaf",
+    "count_leaves",
+    "disable_statistics",
+    "enable_statistics",
+    "find_leaf",
     "format_exception",
     "format_exception_only",
+    "formatting_limits",
+    "get_statistics",
+    "iter_leaves",
+    "leaf_only",
+    "partition",
     "print_exception",
     "print_exc",
     "suppress",
@@ -13,6 +26,23 @@ import os
 import sys
 
 from ._catch import catch
+from ._collector import ExceptionCollector
+from ._limits import formatting_limits
+from ._stats import (
+    ExceptionStatistics,
+    disable_statistics,
+    enable_statistics,
+    get_statistics,
+)
+from ._utils import (
+    batch_split,
+    contains_leaf,
+    count_leaves,
+    find_leaf,
+    iter_leaves,
+    leaf_only,
+    partition,
+)
 from ._version import version as __version__  # noqa: F401
 
 if sys.version_info < (3, 11):
@@ -30,12 +60,9 @@ if sys.version_info < (3, 11):
     BaseExceptionGroup.__module__ = __name__
     ExceptionGroup.__module__ = __name__
 else:
-    from traceback import (
-        format_exception,
-        format_exception_only,
-        print_exc,
-        print_exception,
-    )
+    from traceback import format_exception_only, print_exc
+
+    from ._formatting_py311 import format_exception, print_exception
 
     BaseExceptionGroup = BaseExceptionGroup
     ExceptionGroup = ExceptionGroup
@@ -3,20 +3,75 @@ from __future__ import annotations
 import inspect
 import sys
 from collections.abc import Callable, Iterable, Mapping
-from contextlib import AbstractContextManager
+from time import perf_counter
 from types import TracebackType
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast, overload
+
+from . import _stats
+from ._exceptions import _copy_group, _TypeMatcher, get_condition_filter
+from ._utils import _iter_leaf_exceptions, leaf_only, partition
 
 if sys.version_info < (3, 11):
-    from ._exceptions import BaseExceptionGroup
+    from ._exceptions import BaseExceptionGroup, _get_nested_types
 
 if TYPE_CHECKING:
+    if sys.version_info >= (3, 8):
+        from typing import Literal
+    else:
+        from typing_extensions import Literal
+
     _Handler = Callable[[BaseExceptionGroup[Any]], Any]
+    _LeafHandler = Callable[[BaseException], Any]
+
+
+def _contains_match(group: BaseExceptionGroup[Any], matcher: _TypeMatcher) -> bool:
+    if sys.version_info < (3, 11):
+        # The backported groups cache the types of their nested exceptions, so a
+        # group that has been seen before only needs its types checked
+        return matcher.classify(_get_nested_types(group)) is not False
+
+    stack = [iter(group.exceptions)]
+    while stack:
+        for exc in stack[-1]:
+            if matcher(exc):
+                return True
+
+            if isinstance(exc, BaseExceptionGroup):
+                stack.append(iter(exc.exceptions))
+                break
+        else:
+            del stack[-1]
+
+    return False
 
 
 class _Catcher:
-    def __init__(self, handler_map: Mapping[tuple[type[BaseException], ...], _Handler]):
-        self._handler_map = handler_map
+    # Catchers hold no per-use state, so a single instance can be entered any number of
+    # times, including concurrently from multiple threads or tasks
+    __slots__ = ("_any_condition", "_conditions", "_handlers", "_per_leaf")
+
+    def __init__(
+        self,
+        handler_map: Mapping[tuple[type[BaseException], ...], _Handler],
+        per_leaf: bool = False,
+    ):
+        self._conditions = tuple(
+            get_condition_filter(exc_types) for exc_types in handler_map
+        )
+        self._handlers = tuple(handler_map.values())
+        self._any_condition = cast(
+            _TypeMatcher,
+            get_condition_filter(
+                tuple(
+                    {
+                        exc_type: None
+                        for exc_types in handler_map
+                        for exc_type in exc_types
+                    }
+                )
+            ),
+        )
+        self._per_leaf = per_leaf
 
     def __enter__(self) -> None:
         pass
@@ -28,80 +83,237 @@ class _Catcher:
         tb: TracebackType | None,
     ) -> bool:
         if exc is not None:
-            unhandled = self.handle_exception(exc)
-            if unhandled is exc:
-                return False
-            elif unhandled is None:
-                return True
-            else:
-                if isinstance(exc, BaseExceptionGroup):
-                    try:
-                        raise unhandled from exc.__cause__
-                    except BaseExceptionGroup:
-                        # Change __context__ to __cause__ because Python 3.11 does this
-                        # too
-                        unhandled.__context__ = exc.__cause__
-                        raise
+            return self.reraise(exc, self.handle_exception(exc))
 
-                raise unhandled from exc
+        return False
+
+    async def __aenter__(self) -> None:
+        pass
+
+    async def __aexit__(
+        self,
+        etype: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> bool:
+        if exc is not None:
+            return self.reraise(exc, await self.handle_exception_async(exc))
 
         return False
 
-    def handle_exception(self, exc: BaseException) -> BaseException | None:
-        excgroup: BaseExceptionGroup | None
-        if isinstance(exc, BaseExceptionGroup):
-            excgroup = exc
+    @staticmethod
+    def reraise(exc: BaseException, unhandled: BaseException | None) -> bool:
+        if unhandled is exc:
+            return False
+        elif unhandled is None:
+            return True
         else:
-            excgroup = BaseExceptionGroup("", [exc])
+            if isinstance(exc, BaseExceptionGroup):
+                try:
+                    raise unhandled from exc.__cause__
+                except BaseExceptionGroup:
+                    # Change __context__ to __cause__ because Python 3.11 does this
+                    # too
+                    unhandled.__context__ = exc.__cause__
+                    raise
+
+            raise unhandled from exc
+
+    def first_handler(self, exc: BaseException) -> _Handler | None:
+        for condition, handler in zip(self._conditions, self._handlers):
+            if condition(exc):
+                return handler
+
+        return None
+
+    def match(
+        self, exc: BaseException
+    ) -> tuple[list[tuple[_Handler, BaseException]], BaseException | None]:
+        """
+        Pair up the handlers with the exceptions they should handle.
+
+        :return: a tuple of (list of (handler, matched exception group or leaf
+            exception), the unhandled remainder)
+
+        """
+        if not self._handlers:
+            # With no handlers, nothing is ever split off, so the exception is
+            # re-raised as is
+            return [], exc
+        elif not isinstance(exc, BaseExceptionGroup):
+            if not self._any_condition(exc):
+                return [], exc
 
+            # Fast path for a naked exception: only the first matching handler gets to
+            # see it, so there's no need to wrap it in a group just to split it
+            handler = cast("_Handler", self.first_handler(exc))
+            if self._per_leaf:
+                return [(handler, exc)], None
+
+            return [(handler, BaseExceptionGroup("", [exc]))], None
+        elif self._per_leaf:
+            # The conditions only look at the exception types, so the handler lookups
+            # can be shared between leaves of the same type
+            handlers: dict[type[BaseException], _Handler | None] = {}
+            matches = []
+            for leaf in _iter_leaf_exceptions(exc):
+                leaf_type = type(leaf)
+                if leaf_type in handlers:
+                    handler = handlers[leaf_type]
+                else:
+                    handler = handlers[leaf_type] = self.first_handler(leaf)
+
+                if handler is not None:
+                    matches.append((handler, leaf))
+
+            if matches:
+                # Regroup the leaves that weren't handled in one go
+                handled = {id(leaf) for _, leaf in matches}
+                excgroup = exc.subgroup(leaf_only(lambda leaf: id(leaf) not in handled))
+                return matches, excgroup
+        elif self._any_condition(exc) or _contains_match(exc, self._any_condition):
+            # Split the group between all the handlers in a single pass
+            *matched_groups, excgroup = partition(exc, self._conditions)
+            matches = [
+                (handler, matched)
+                for handler, matched in zip(self._handlers, matched_groups)
+                if matched
+            ]
+            return matches, excgroup
+
+        # No handler can match anything in the group, so skip splitting it and just
+        # make the copy that except* would re-raise
+        return [], _copy_group(exc)
+
+    def handle_exception(self, exc: BaseException) -> BaseException | None:
+        stats = _stats._statistics
+        matches, unhandled = self.match(exc)
         new_exceptions: list[BaseException] = []
-        for exc_types, handler in self._handler_map.items():
-            matched, excgroup = excgroup.split(exc_types)
-            if matched:
-                try:
+        for handler, matched in matches:
+            if stats is not None:
+                start_time = perf_counter()
+
+            # The handler must see the matched group as the exception currently being
+            # handled (in sys.exc_info() and for a bare "raise"), and the only way to
+            # set that up from Python code is to actually raise it
+            try:
+                if self._per_leaf:
+                    result = handler(matched)
+                else:
                     try:
                         raise matched
                     except BaseExceptionGroup:
                         result = handler(matched)
-                except BaseExceptionGroup as new_exc:
-                    if new_exc is matched:
-                        new_exceptions.append(new_exc)
-                    else:
-                        new_exceptions.extend(new_exc.exceptions)
-                except BaseException as new_exc:
-                    new_exceptions.append(new_exc)
+            except BaseException as new_exc:
+                self.add_raised(new_exc, exc, matched, new_exceptions)
+            else:
+                if inspect.iscoroutine(result):
+                    raise TypeError(
+                        f"Error trying to handle {matched!r} with {handler!r}. "
+                        "Exception handler must be a sync function."
+                    ) from exc
+
+            if stats is not None:
+                stats.record_handler_call(handler, perf_counter() - start_time)
+
+        unhandled = self.combine(new_exceptions, unhandled)
+        if stats is not None:
+            stats.record_outcome(exc, unhandled)
+
+        return unhandled
+
+    async def handle_exception_async(self, exc: BaseException) -> BaseException | None:
+        stats = _stats._statistics
+        matches, unhandled = self.match(exc)
+        new_exceptions: list[BaseException] = []
+        for handler, matched in matches:
+            if stats is not None:
+                start_time = perf_counter()
+
+            try:
+                if self._per_leaf:
+                    result = handler(matched)
+                    if inspect.isawaitable(result):
+                        await result
                 else:
-                    if inspect.iscoroutine(result):
-                        raise TypeError(
-                            f"Error trying to handle {matched!r} with {handler!r}. "
-                            "Exception handler must be a sync function."
-                        ) from exc
+                    try:
+                        raise matched
+                    except BaseExceptionGroup:
+                        result = handler(matched)
+                        if inspect.isawaitable(result):
+                            await result
+            except BaseException as new_exc:
+                self.add_raised(new_exc, exc, matched, new_exceptions)
 
-            if not excgroup:
-                break
+            if stats is not None:
+                stats.record_handler_call(handler, perf_counter() - start_time)
 
+        unhandled = self.combine(new_exceptions, unhandled)
+        if stats is not None:
+            stats.record_outcome(exc, unhandled)
+
+        return unhandled
+
+    def add_raised(
+        self,
+        new_exc: BaseException,
+        exc: BaseException,
+        matched: BaseException,
+        new_exceptions: list[BaseException],
+    ) -> None:
+        if new_exc is matched:
+            new_exceptions.append(new_exc)
+        elif self._per_leaf and new_exc is exc:
+            # A bare "raise" in a per-leaf handler re-raises the original exception, as
+            # the leaf was never raised on its own, so treat it as re-raising the leaf
+            new_exceptions.append(matched)
+        elif isinstance(new_exc, BaseExceptionGroup):
+            new_exceptions.extend(new_exc.exceptions)
+        else:
+            new_exceptions.append(new_exc)
+
+    @staticmethod
+    def combine(
+        new_exceptions: list[BaseException], unhandled: BaseException | None
+    ) -> BaseException | None:
         if new_exceptions:
             if len(new_exceptions) == 1:
                 return new_exceptions[0]
 
             return BaseExceptionGroup("", new_exceptions)
-        elif (
-            excgroup and len(excgroup.exceptions) == 1 and excgroup.exceptions[0] is exc
-        ):
-            return exc
         else:
-            return excgroup
+            return unhandled
 
 
+@overload
 def catch(
     __handlers: Mapping[type[BaseException] | Iterable[type[BaseException]], _Handler],
-) -> AbstractContextManager[None]:
+    *,
+    per_leaf: Literal[False] = ...,
+) -> _Catcher: ...
+
+
+@overload
+def catch(
+    __handlers: Mapping[
+        type[BaseException] | Iterable[type[BaseException]], _LeafHandler
+    ],
+    *,
+    per_leaf: Literal[True],
+) -> _Catcher: ...
+
+
+def catch(
+    __handlers: Mapping[
+        type[BaseException] | Iterable[type[BaseException]], _Handler | _LeafHandler
+    ],
+    *,
+    per_leaf: bool = False,
+) -> _Catcher:
     if not isinstance(__handlers, Mapping):
         raise TypeError("the argument must be a mapping")
 
-    handler_map: dict[
-        tuple[type[BaseException], ...], Callable[[BaseExceptionGroup]]
-    ] = {}
+    handler_map: dict[tuple[type[BaseException], ...], Any] = {}
     for type_or_iterable, handler in __handlers.items():
         iterable: tuple[type[BaseException]]
         if isinstance(type_or_iterable, type) and issubclass(
@@ -135,4 +347,4 @@ def catch(
 
         handler_map[iterable] = handler
 
-    return _Catcher(handler_map)
+    return _Catcher(handler_map, per_leaf)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+
+if sys.version_info < (3, 11):
+    from ._exceptions import BaseExceptionGroup
+
+
+class ExceptionCollector:
+    """
+    Collects exceptions one at a time for raising them later as an exception group.
+
+    Up to ``max_exceptions`` exceptions are retained as they are. Any exceptions added
+    after that are dropped, and only the number of dropped exceptions per exception type
+    is kept. The group produced by :meth:`build` then gets a note summarizing what was
+    dropped.
+
+    :param max_exceptions: the maximum number of exceptions to retain, or ``None`` to
+        retain all of them
+
+    """
+
+    def __init__(self, max_exceptions: int | None = None) -> None:
+        if max_exceptions is not None and max_exceptions < 1:
+            raise ValueError("max_exceptions must be at least 1")
+
+        self._max_exceptions = max_exceptions
+        self._exceptions: list[BaseException] = []
+        self._dropped: dict[type[BaseException], int] = {}
+        self._num_dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._exceptions) + self._num_dropped
+
+    @property
+    def exceptions(self) -> tuple[BaseException, ...]:
+        """The retained exceptions."""
+        return tuple(self._exceptions)
+
+    @property
+    def dropped(self) -> Mapping[type[BaseException], int]:
+        """The number of dropped exceptions, per exception type."""
+        return MappingProxyType(self._dropped)
+
+    def add(self, exc: BaseException) -> None:
+        """
+        Add an exception to the collection.
+
+        :param exc: the exception to add
+
+        """
+        if not isinstance(exc, BaseException):
+            raise TypeError(f"expected an exception, got {type(exc).__name__} instead")
+
+        if self._max_exceptions is None or len(self._exceptions) < self._max_exceptions:
+            self._exceptions.append(exc)
+        else:
+            exc_type = type(exc)
+            self._dropped[exc_type] = self._dropped.get(exc_type, 0) + 1
+            self._num_dropped += 1
+
+    def build(self, message: str) -> BaseExceptionGroup[BaseException] | None:
+        """
+        Create an exception group from the collected exceptions.
+
+        :param message: the message of the exception group
+        :return: an exception group containing the retained exceptions, or ``None`` if
+            no exceptions have been added
+
+        """
+        if not self._exceptions:
+            return None
+
+        group = BaseExceptionGroup(message, list(self._exceptions))
+        if self._num_dropped:
+            counts = ", ".join(
+                f"{exc_type.__qualname__}: {count}"
+                for exc_type, count in sorted(
+                    self._dropped.items(), key=lambda item: item[1], reverse=True
+                )
+            )
+            plural = "s" if self._num_dropped > 1 else ""
+            group.add_note(
+                f"{self._num_dropped} more exception{plural} dropped ({counts})"
+            )
+
+        return group
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import sys
-from collections.abc import Callable, Sequence
-from functools import partial
-from inspect import getmro, isclass
-from typing import TYPE_CHECKING, Generic, Type, TypeVar, cast, overload
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from functools import lru_cache
+from inspect import isclass
+from operator import is_
+from typing import TYPE_CHECKING, Any, Generic, Type, TypeVar, cast, overload
 
 if sys.version_info < (3, 13):
     from typing_extensions import TypeVar
@@ -22,14 +23,87 @@ _ExceptionGroupSelf = TypeVar("_ExceptionGroupSelf", bound="ExceptionGroup")
 _BaseExceptionGroupSelf = TypeVar("_BaseExceptionGroupSelf", bound="BaseExceptionGroup")
 
 
-def check_direct_subclass(
-    exc: BaseException, parents: tuple[type[BaseException]]
-) -> bool:
-    for cls in getmro(exc.__class__)[:-1]:
-        if cls in parents:
-            return True
+class _TypeMatcher:
+    """
+    Condition filter matching exceptions against a fixed tuple of exception types.
+
+    The verdict for each concrete exception class is memoized, so the MRO of a class is
+    only walked once no matter how many leaves of that class are checked.
+    """
+
+    __slots__ = ("types", "_verdicts")
+
+    def __init__(self, types: tuple[type[BaseException], ...]) -> None:
+        self.types = types
+        self._verdicts: dict[type, bool] = {}
+
+    def __call__(self, exc: BaseException) -> bool:
+        return self.matches_class(exc.__class__)
+
+    def matches_class(self, cls: type) -> bool:
+        verdict = self._verdicts.get(cls)
+        if verdict is None:
+            verdict = False
+            for parent in cls.__mro__:
+                if parent in self.types:
+                    verdict = True
+                    break
+
+            # Keep the cache bounded in case exception classes are created dynamically
+            if len(self._verdicts) >= _MAX_CACHED_VERDICTS:
+                self._verdicts.clear()
+
+            self._verdicts[cls] = verdict
+
+        return verdict
+
+    def classify(self, types: Iterable[type]) -> bool | None:
+        """
+        Check the types of all the exceptions nested within a group at once.
+
+        :return: ``True`` if all the leaf exceptions match, ``False`` if no exception
+            matches, or ``None`` if there's a mix
+
+        """
+        any_match = False
+        all_leaves_match = True
+        for cls in types:
+            if self.matches_class(cls):
+                any_match = True
+            elif not issubclass(cls, BaseExceptionGroup):
+                all_leaves_match = False
+
+            if any_match and not all_leaves_match:
+                return None
+
+        return any_match
 
-    return False
+
+_MAX_CACHED_VERDICTS = 256
+
+
+class _LeafOnlyCondition:
+    """
+    Condition filter that only passes leaf exceptions to the wrapped predicate.
+
+    Exception groups never match it.
+    """
+
+    __slots__ = ("predicate",)
+
+    def __init__(self, predicate: Callable[[BaseException], bool]) -> None:
+        self.predicate = predicate
+
+    def __call__(self, exc: BaseException) -> bool:
+        return not isinstance(exc, BaseExceptionGroup) and self.predicate(exc)
+
+
+@lru_cache(maxsize=128)
+def _compile_type_condition(types: tuple[type[BaseException], ...]) -> _TypeMatcher:
+    if not all(isclass(x) and issubclass(x, BaseException) for x in types):
+        raise TypeError("expected a tuple of exception types")
+
+    return _TypeMatcher(types)
 
 
 def get_condition_filter(
@@ -40,10 +114,13 @@ def get_condition_filter(
     if isclass(condition) and issubclass(
         cast(Type[BaseException], condition), BaseException
     ):
-        return partial(check_direct_subclass, parents=(condition,))
+        return _compile_type_condition((condition,))
     elif isinstance(condition, tuple):
-        if all(isclass(x) and issubclass(x, BaseException) for x in condition):
-            return partial(check_direct_subclass, parents=condition)
+        try:
+            return _compile_type_condition(condition)
+        except TypeError:
+            # either an unhashable item or something other than an exception type
+            pass
     elif callable(condition):
         return cast("Callable[[BaseException], bool]", condition)
 
@@ -51,7 +128,13 @@ def get_condition_filter(
 
 
 def _derive_and_copy_attributes(self, excs):
-    eg = self.derive(excs)
+    if type(self).derive is BaseExceptionGroup.derive:
+        # The exceptions were taken from existing groups and have thus already been
+        # validated, so skip the checks that the default derive() would go through
+        eg = _create_group_unchecked(self.message, excs)
+    else:
+        eg = self.derive(excs)
+
     eg.__cause__ = self.__cause__
     eg.__context__ = self.__context__
     eg.__traceback__ = self.__traceback__
@@ -61,6 +144,187 @@ def _derive_and_copy_attributes(self, excs):
     return eg
 
 
+def _copy_group(
+    group: BaseExceptionGroup[_BaseExceptionT],
+) -> BaseExceptionGroup[_BaseExceptionT]:
+    """
+    Make the copy of the group that ``split()`` would return if nothing was split off.
+
+    Like with ``split()``, ``derive()`` is given a list of the exceptions.
+
+    """
+    return _derive_and_copy_attributes(group, list(group.exceptions))
+
+
+def _create_group_unchecked(
+    message: str, excs: Sequence[BaseException]
+) -> BaseExceptionGroup[Any]:
+    """
+    Create an exception group like ``BaseExceptionGroup(message, excs)`` would, minus
+    the validation of the arguments.
+
+    """
+    cls: type[BaseExceptionGroup[Any]] = BaseExceptionGroup
+    if all(isinstance(exc, Exception) for exc in excs):
+        cls = ExceptionGroup
+
+    eg = super(BaseExceptionGroup, cls).__new__(cls, message, excs)
+    eg._exceptions = tuple(excs)
+    return eg
+
+
+def _split_group(
+    group: BaseExceptionGroup[Any],
+    condition: Callable[[BaseException], bool],
+    construct_rest: bool,
+) -> tuple[list[BaseException], list[BaseException]]:
+    """
+    Sort the nested exceptions of the given group into matching and non-matching ones.
+
+    Nested exception groups are processed using an explicit stack rather than
+    recursion, so arbitrarily deep trees can be split. Nested groups whose exceptions
+    all land on the same side are passed through as-is. Other nested groups are
+    replaced with their matching and non-matching parts, derived from the originals.
+
+    When the condition is an exception type (or a tuple of them), the types of the
+    exceptions nested within each group are collected along the way and cached on the
+    group. Subsequent splits by type then use them to pass entire groups to one side
+    without visiting their contents.
+
+    :return: a tuple of (matching exceptions, non-matching exceptions) directly under
+        ``group``
+
+    """
+    # Leaf-only predicates can be called directly, as long as groups are skipped
+    leaves_only = isinstance(condition, _LeafOnlyCondition)
+    if leaves_only:
+        condition = cast(_LeafOnlyCondition, condition).predicate
+
+    matcher = condition if isinstance(condition, _TypeMatcher) else None
+    if matcher is not None:
+        nested_types = getattr(group, "_nested_types", None)
+        if nested_types is not None:
+            verdict = matcher.classify(nested_types)
+            if verdict:
+                return list(group._exceptions), []
+            elif verdict is not None:
+                return [], list(group._exceptions) if construct_rest else []
+
+    types: set[type] | None = None if matcher is None else set()
+    matching_exceptions: list[BaseException] = []
+    nonmatching_exceptions: list[BaseException] = []
+    stack = [
+        (
+            group,
+            iter(group._exceptions),
+            matching_exceptions,
+            nonmatching_exceptions,
+            types,
+        )
+    ]
+    while True:
+        eg, iterator, matching, nonmatching, types = stack[-1]
+        for exc in iterator:
+            if types is not None:
+                types.add(exc.__class__)
+
+            if (
+                not leaves_only or not isinstance(exc, BaseExceptionGroup)
+            ) and condition(exc):
+                matching.append(exc)
+                if types is not None and isinstance(exc, BaseExceptionGroup):
+                    types.update(_get_nested_types(exc))
+            elif isinstance(exc, BaseExceptionGroup):
+                verdict: bool | None = None
+                subtypes: set[type] | None = None
+                if matcher is not None:
+                    nested_types = getattr(exc, "_nested_types", None)
+                    if nested_types is None:
+                        subtypes = set()
+                    else:
+                        verdict = matcher.classify(nested_types)
+                        if types is not None:
+                            types.update(nested_types)
+
+                if verdict is None:
+                    stack.append((exc, iter(exc._exceptions), [], [], subtypes))
+                    break
+                elif verdict:
+                    matching.append(exc)
+                elif construct_rest:
+                    nonmatching.append(exc)
+            elif construct_rest:
+                nonmatching.append(exc)
+        else:
+            del stack[-1]
+            if types is not None:
+                eg._nested_types = frozenset(types)
+
+            if not stack:
+                return matching, nonmatching
+
+            # Reuse nested groups that end up entirely on one side; only derive new
+            # groups along the paths where the matching and non-matching parts diverge
+            _, _, parent_matching, parent_nonmatching, parent_types = stack[-1]
+            if parent_types is not None and types is not None:
+                parent_types.update(types)
+
+            if construct_rest:
+                if not nonmatching:
+                    parent_matching.append(eg)
+                elif not matching:
+                    parent_nonmatching.append(eg)
+                else:
+                    parent_matching.append(_derive_and_copy_attributes(eg, matching))
+                    parent_nonmatching.append(
+                        _derive_and_copy_attributes(eg, nonmatching)
+                    )
+            elif matching:
+                if _is_same_sequence(matching, eg._exceptions):
+                    parent_matching.append(eg)
+                else:
+                    parent_matching.append(_derive_and_copy_attributes(eg, matching))
+
+
+def _get_nested_types(group: BaseExceptionGroup[Any]) -> frozenset[type]:
+    """
+    Return the types of all the exceptions nested within the group, at any depth.
+
+    The result is cached on the group, and on each of its nested groups along the way.
+
+    """
+    nested_types: frozenset[type] | None = getattr(group, "_nested_types", None)
+    if nested_types is not None:
+        return nested_types
+
+    stack: list[tuple[BaseExceptionGroup[Any], Iterator[BaseException], set[type]]]
+    stack = [(group, iter(group._exceptions), set())]
+    while True:
+        eg, iterator, types = stack[-1]
+        for exc in iterator:
+            types.add(exc.__class__)
+            if isinstance(exc, BaseExceptionGroup):
+                nested_types = getattr(exc, "_nested_types", None)
+                if nested_types is None:
+                    stack.append((exc, iter(exc._exceptions), set()))
+                    break
+
+                types.update(nested_types)
+        else:
+            del stack[-1]
+            eg._nested_types = nested_types = frozenset(types)
+            if not stack:
+                return nested_types
+
+            stack[-1][2].update(nested_types)
+
+
+def _is_same_sequence(
+    excs: Sequence[BaseException], exceptions: Sequence[BaseException]
+) -> bool:
+    return len(excs) == len(exceptions) and all(map(is_, excs, exceptions))
+
+
 class BaseExceptionGroup(BaseException, Generic[_BaseExceptionT_co]):
     """A combination of multiple unrelated exceptions."""
 
@@ -78,30 +342,31 @@ class BaseExceptionGroup(BaseException, Generic[_BaseExceptionT_co]):
                 "second argument (exceptions) must be a non-empty sequence"
             )
 
-        for i, exc in enumerate(__exceptions):
-            if not isinstance(exc, BaseException):
-                raise ValueError(
-                    f"Item {i} of second argument (exceptions) is not an exception"
-                )
+        # Validate the exceptions and check if they're all Exception instances in a
+        # single pass over the stored tuple
+        exceptions = tuple(__exceptions)
+        all_exceptions = True
+        for exc in exceptions:
+            if not isinstance(exc, Exception):
+                if not isinstance(exc, BaseException):
+                    i = next(i for i, item in enumerate(exceptions) if item is exc)
+                    raise ValueError(
+                        f"Item {i} of second argument (exceptions) is not an exception"
+                    )
+
+                all_exceptions = False
 
         if cls is BaseExceptionGroup:
-            if all(isinstance(exc, Exception) for exc in __exceptions):
+            if all_exceptions:
                 cls = ExceptionGroup
-
-        if issubclass(cls, Exception):
-            for exc in __exceptions:
-                if not isinstance(exc, Exception):
-                    if cls is ExceptionGroup:
-                        raise TypeError(
-                            "Cannot nest BaseExceptions in an ExceptionGroup"
-                        )
-                    else:
-                        raise TypeError(
-                            f"Cannot nest BaseExceptions in {cls.__name__!r}"
-                        )
+        elif not all_exceptions and issubclass(cls, Exception):
+            if cls is ExceptionGroup:
+                raise TypeError("Cannot nest BaseExceptions in an ExceptionGroup")
+            else:
+                raise TypeError(f"Cannot nest BaseExceptions in {cls.__name__!r}")
 
         instance = super().__new__(cls, __message, __exceptions)
-        instance._exceptions = tuple(__exceptions)
+        instance._exceptions = exceptions
         return instance
 
     def __init__(
@@ -131,7 +396,7 @@ class BaseExceptionGroup(BaseException, Generic[_BaseExceptionT_co]):
     def exceptions(
         self,
     ) -> tuple[_BaseExceptionT_co | BaseExceptionGroup[_BaseExceptionT_co], ...]:
-        return tuple(self._exceptions)
+        return self._exceptions
 
     @overload
     def subgroup(
@@ -156,29 +421,14 @@ class BaseExceptionGroup(BaseException, Generic[_BaseExceptionT_co]):
         | Callable[[_BaseExceptionT_co | _BaseExceptionGroupSelf], bool],
     ) -> BaseExceptionGroup[_BaseExceptionT] | None:
         condition = get_condition_filter(__condition)
-        modified = False
         if condition(self):
             return self
 
-        exceptions: list[BaseException] = []
-        for exc in self.exceptions:
-            if isinstance(exc, BaseExceptionGroup):
-                subgroup = exc.subgroup(__condition)
-                if subgroup is not None:
-                    exceptions.append(subgroup)
-
-                if subgroup is not exc:
-                    modified = True
-            elif condition(exc):
-                exceptions.append(exc)
-            else:
-                modified = True
-
-        if not modified:
+        exceptions, _ = _split_group(self, condition, construct_rest=False)
+        if _is_same_sequence(exceptions, self._exceptions):
             return self
         elif exceptions:
-            group = _derive_and_copy_attributes(self, exceptions)
-            return group
+            return _derive_and_copy_attributes(self, exceptions)
         else:
             return None
 
@@ -230,21 +480,9 @@ class BaseExceptionGroup(BaseException, Generic[_BaseExceptionT_co]):
         if condition(self):
             return self, None
 
-        matching_exceptions: list[BaseException] = []
-        nonmatching_exceptions: list[BaseException] = []
-        for exc in self.exceptions:
-            if isinstance(exc, BaseExceptionGroup):
-                matching, nonmatching = exc.split(condition)
-                if matching is not None:
-                    matching_exceptions.append(matching)
-
-                if nonmatching is not None:
-                    nonmatching_exceptions.append(nonmatching)
-            elif condition(exc):
-                matching_exceptions.append(exc)
-            else:
-                nonmatching_exceptions.append(exc)
-
+        matching_exceptions, nonmatching_exceptions = _split_group(
+            self, condition, construct_rest=True
+        )
         matching_group: _BaseExceptionGroupSelf | None = None
         if matching_exceptions:
             matching_group = _derive_and_copy_attributes(self, matching_exceptions)
@@ -5,17 +5,22 @@
 from __future__ import annotations
 
 import collections.abc
+import linecache
 import sys
 import textwrap
 import traceback
+from collections import deque
 from functools import singledispatch
-from types import TracebackType
-from typing import Any, List, Optional
+from itertools import islice
+from types import CodeType, FrameType, TracebackType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from ._exceptions import BaseExceptionGroup
+from ._limits import _formatting_limits, _limit_lines
 
 max_group_width = 15
 max_group_depth = 10
+_FrameCache = Dict[Tuple[CodeType, int], traceback.FrameSummary]
 _cause_message = (
     "\nThe above exception was the direct cause of the following exception:\n\n"
 )
@@ -43,10 +48,12 @@ def _safe_string(value, what, func=str):
 
 
 class _ExceptionPrintContext:
-    def __init__(self):
+    def __init__(self, max_group_width, max_group_depth):
         self.seen = set()
         self.exception_group_depth = 0
         self.need_close = False
+        self.max_group_width = max_group_width
+        self.max_group_depth = max_group_depth
 
     def indent(self):
         return " " * (2 * self.exception_group_depth)
@@ -65,6 +72,125 @@ class _ExceptionPrintContext:
                 yield textwrap.indent(text, indent_str, lambda line: True)
 
 
+def _get_group_limits(width: int | None, depth: int | None) -> tuple[int | None, int]:
+    # Explicitly given limits take precedence over the ones set for the current
+    # context, which take precedence over the module level defaults
+    overrides = _formatting_limits.get()
+    if width is None:
+        width = overrides.get("max_group_width", max_group_width)
+    if depth is None:
+        depth = overrides.get("max_group_depth", max_group_depth)
+
+    return width, depth
+
+
+def _cap_limit(limit: int | None, captured: int | None) -> int | None:
+    if limit is None:
+        return captured
+    elif captured is None:
+        return limit
+
+    return min(limit, captured)
+
+
+def _limit_frames(
+    frame_gen: Iterator[tuple[FrameType, int]], limit: int | None
+) -> Iterable[tuple[FrameType, int]]:
+    # Same as in traceback.StackSummary.extract()
+    if limit is None:
+        limit = getattr(sys, "tracebacklimit", None)
+        if limit is not None and limit < 0:
+            limit = 0
+
+    if limit is not None:
+        if limit >= 0:
+            return islice(frame_gen, limit)
+        else:
+            return deque(frame_gen, maxlen=-limit)
+
+    return frame_gen
+
+
+def _extract_stack(
+    exc_traceback: TracebackType | None,
+    limit: int | None,
+    lookup_lines: bool,
+    capture_locals: bool,
+    frame_cache: _FrameCache,
+) -> traceback.StackSummary:
+    if capture_locals:
+        # The frame summaries carry the values of the locals at the time, so they
+        # can't be shared
+        stack = traceback.StackSummary.extract(
+            traceback.walk_tb(exc_traceback),
+            limit=limit,
+            lookup_lines=lookup_lines,
+            capture_locals=True,
+        )
+        new_frames: list[traceback.FrameSummary] = stack
+    else:
+        # Share the frame summaries (and their source lines) between all the
+        # exceptions being captured, as the exceptions in a group often have much of
+        # their stacks in common
+        stack = traceback.StackSummary()
+        new_frames = []
+        for frame, lineno in _limit_frames(traceback.walk_tb(exc_traceback), limit):
+            key = (frame.f_code, lineno)
+            try:
+                summary = frame_cache[key]
+            except KeyError:
+                code = frame.f_code
+                linecache.lazycache(code.co_filename, frame.f_globals)
+                summary = frame_cache[key] = traceback.FrameSummary(
+                    code.co_filename, lineno, code.co_name, lookup_line=False
+                )
+                new_frames.append(summary)
+
+            stack.append(summary)
+
+        for filename in {summary.filename for summary in new_frames}:
+            linecache.checkcache(filename)
+
+    if lookup_lines:
+        # Force all lines in the stack to be loaded
+        for summary in new_frames:
+            summary.line
+
+    return stack
+
+
+def _collapse_identical(
+    exceptions: Sequence[BaseException], limit: int | None
+) -> tuple[list[BaseException], list[int]]:
+    # Group the exceptions by their type, message and the locations in their stack
+    # traces, keeping the first exception from each of the first "limit" groups
+    counts: dict[Any, int] = {}
+    representatives: list[BaseException] = []
+    for exc in exceptions:
+        if isinstance(exc, BaseExceptionGroup):
+            # Exception groups are never considered identical (and they may not even
+            # be hashable)
+            key: Any = id(exc)
+        else:
+            # The code objects are kept alive by the tracebacks, so their IDs will
+            # do (and they're much faster to hash)
+            locations: list[int] = []
+            tb = exc.__traceback__
+            while tb is not None:
+                locations += id(tb.tb_frame.f_code), tb.tb_lineno
+                tb = tb.tb_next
+
+            key = (type(exc), _safe_string(exc, "exception"), tuple(locations))
+
+        if key in counts:
+            counts[key] += 1
+        elif limit is None or len(counts) < limit:
+            counts[key] = 1
+            representatives.append(exc)
+
+    return representatives, list(counts.values())
+
+
 def exceptiongroup_excepthook(
     etype: type[BaseException], value: BaseException, tb: TracebackType | None
 ) -> None:
@@ -82,23 +208,45 @@ class PatchedTracebackException(traceback.TracebackException):
         lookup_lines: bool = True,
         capture_locals: bool = False,
         compact: bool = False,
+        max_group_width: int | None = None,
+        max_group_depth: int | None = None,
+        defer_stack: bool = False,
+        collapse_identical: bool = False,
         _seen: set[int] | None = None,
+        _frame_cache: _FrameCache | None = None,
     ) -> None:
         kwargs: dict[str, Any] = {}
         if sys.version_info >= (3, 10):
             kwargs["compact"] = compact
 
+        max_group_width, max_group_depth = _get_group_limits(
+            max_group_width, max_group_depth
+        )
+        self.max_group_width = max_group_width
+        self.max_group_depth = max_group_depth
+
         is_recursive_call = _seen is not None
         if _seen is None:
             _seen = set()
         _seen.add(id(exc_value))
+        if _frame_cache is None:
+            _frame_cache = {}
+
+        if defer_stack and isinstance(self, PatchedTracebackException):
+            # Hold on to the traceback until (and unless) format() gets to this
+            # exception
+            self._pending_stack = (
+                exc_traceback,
+                limit,
+                lookup_lines,
+                capture_locals,
+                _frame_cache,
+            )
+        else:
+            self.stack = _extract_stack(
+                exc_traceback, limit, lookup_lines, capture_locals, _frame_cache
+            )
 
-        self.stack = traceback.StackSummary.extract(
-            traceback.walk_tb(exc_traceback),
-            limit=limit,
-            lookup_lines=lookup_lines,
-            capture_locals=capture_locals,
-        )
         self.exc_type = exc_type
         # Capture now to permit freeing resources: only complication is in the
         # unofficial API _format_final_exc_line
@@ -135,11 +283,6 @@ class PatchedTracebackException(traceback.TracebackException):
             if suggestion:
                 self._str += f". Did you mean: '{suggestion}'?"
 
-        if lookup_lines:
-            # Force all lines in the stack to be loaded
-            for frame in self.stack:
-                frame.line
-
         self.__suppress_context__ = (
             exc_value.__suppress_context__ if exc_value is not None else False
         )
@@ -147,9 +290,10 @@ class PatchedTracebackException(traceback.TracebackException):
         # Convert __cause__ and __context__ to `TracebackExceptions`s, use a
         # queue to avoid recursion (only the top-level call gets _seen == None)
         if not is_recursive_call:
-            queue = [(self, exc_value)]
+            # Each queue entry also holds the group nesting level of the exception
+            queue = [(self, exc_value, 0)]
             while queue:
-                te, e = queue.pop()
+                te, e, level = queue.pop()
 
                 if e and e.__cause__ is not None and id(e.__cause__) not in _seen:
                     cause = PatchedTracebackException(
@@ -159,7 +303,12 @@ class PatchedTracebackException(traceback.TracebackException):
                         limit=limit,
                         lookup_lines=lookup_lines,
                         capture_locals=capture_locals,
+                        max_group_width=max_group_width,
+                        max_group_depth=max_group_depth,
+                        defer_stack=defer_stack,
+                        collapse_identical=collapse_identical,
                         _seen=_seen,
+                        _frame_cache=_frame_cache,
                     )
                 else:
                     cause = None
@@ -183,23 +332,47 @@ class PatchedTracebackException(traceback.TracebackException):
                         limit=limit,
                         lookup_lines=lookup_lines,
                         capture_locals=capture_locals,
+                        max_group_width=max_group_width,
+                        max_group_depth=max_group_depth,
+                        defer_stack=defer_stack,
+                        collapse_identical=collapse_identical,
                         _seen=_seen,
+                        _frame_cache=_frame_cache,
                     )
                 else:
                     context = None
 
                 # Capture each of the exceptions in the ExceptionGroup along with each
-                # of their causes and contexts
+                # of their causes and contexts. Only the ones format() will actually
+                # render are captured: the rest are only counted.
+                repeat_counts = None
                 if e and isinstance(e, BaseExceptionGroup):
                     exceptions = []
-                    for exc in e.exceptions:
+                    if level and level >= max_group_depth:
+                        members: Sequence[BaseException] = ()
+                        te._depth_truncated = True
+                    elif collapse_identical:
+                        members, repeat_counts = _collapse_identical(
+                            e.exceptions, max_group_width
+                        )
+                    elif max_group_width is None:
+                        members = e.exceptions
+                    else:
+                        members = e.exceptions[:max_group_width]
+
+                    for exc in members:
                         texc = PatchedTracebackException(
                             type(exc),
                             exc,
                             exc.__traceback__,
                             lookup_lines=lookup_lines,
                             capture_locals=capture_locals,
+                            max_group_width=max_group_width,
+                            max_group_depth=max_group_depth,
+                            defer_stack=defer_stack,
+                            collapse_identical=collapse_identical,
                             _seen=_seen,
+                            _frame_cache=_frame_cache,
                         )
                         exceptions.append(texc)
                 else:
@@ -208,16 +381,63 @@ class PatchedTracebackException(traceback.TracebackException):
                 te.__cause__ = cause
                 te.__context__ = context
                 te.exceptions = exceptions
+                if exceptions is not None:
+                    te._num_exceptions = len(e.exceptions)
+                if repeat_counts is not None:
+                    te._repeat_counts = repeat_counts
                 if cause:
-                    queue.append((te.__cause__, e.__cause__))
+                    queue.append((te.__cause__, e.__cause__, level))
                 if context:
-                    queue.append((te.__context__, e.__context__))
+                    queue.append((te.__context__, e.__context__, level))
                 if exceptions:
-                    queue.extend(zip(te.exceptions, e.exceptions))
+                    queue.extend(
+                        (texc, exc, level + 1) for texc, exc in zip(exceptions, members)
+                    )
+
+    @property
+    def stack(self) -> traceback.StackSummary:
+        pending = self.__dict__.pop("_pending_stack", None)
+        if pending is not None:
+            self.__dict__["stack"] = _extract_stack(*pending)
+
+        return self.__dict__["stack"]
 
-    def format(self, *, chain=True, _ctx=None, **kwargs):
+    @stack.setter
+    def stack(self, stack: traceback.StackSummary) -> None:
+        self.__dict__.pop("_pending_stack", None)
+        self.__dict__["stack"] = stack
+
+    def format(
+        self,
+        *,
+        chain=True,
+        max_group_width=None,
+        max_group_depth=None,
+        max_lines=None,
+        _ctx=None,
+        **kwargs,
+    ):
         if _ctx is None:
-            _ctx = _ExceptionPrintContext()
+            # Default to the limits used when capturing the exceptions, and never go
+            # past them, as anything beyond them was not captured in the first place
+            max_group_width = _cap_limit(
+                max_group_width, getattr(self, "max_group_width", None)
+            )
+            max_group_depth = _cap_limit(
+                max_group_depth, getattr(self, "max_group_depth", None)
+            )
+            _ctx = _ExceptionPrintContext(
+                *_get_group_limits(max_group_width, max_group_depth)
+            )
+            if max_lines is None:
+                max_lines = _formatting_limits.get().get("max_lines")
+
+            if max_lines is not None:
+                if max_lines < 1:
+                    raise ValueError("max_lines must be at least 1")
+
+                yield from _limit_lines(self.format(chain=chain, _ctx=_ctx), max_lines)
+                return
 
         output = []
         exc = self
@@ -246,9 +466,13 @@ class PatchedTracebackException(traceback.TracebackException):
                     yield from _ctx.emit("Traceback (most recent call last):\n")
                     yield from _ctx.emit(exc.stack.format())
                 yield from _ctx.emit(exc.format_exception_only())
-            elif _ctx.exception_group_depth > max_group_depth:
+            elif _ctx.exception_group_depth > _ctx.max_group_depth or getattr(
+                exc, "_depth_truncated", False
+            ):
                 # exception group, but depth exceeds limit
-                yield from _ctx.emit(f"... (max_group_depth is {max_group_depth})\n")
+                yield from _ctx.emit(
+                    f"... (max_group_depth is {_ctx.max_group_depth})\n"
+                )
             else:
                 # format exception group
                 is_toplevel = _ctx.exception_group_depth == 0
@@ -263,11 +487,20 @@ class PatchedTracebackException(traceback.TracebackException):
                     yield from _ctx.emit(exc.stack.format())
 
                 yield from _ctx.emit(exc.format_exception_only())
-                num_excs = len(exc.exceptions)
-                if num_excs <= max_group_width:
-                    n = num_excs
+                # Exceptions beyond the width limit were only counted, not captured
+                num_excs = getattr(exc, "_num_exceptions", len(exc.exceptions))
+                repeat_counts = getattr(exc, "_repeat_counts", None)
+                if _ctx.max_group_width is None:
+                    width = len(exc.exceptions)
                 else:
-                    n = max_group_width + 1
+                    width = min(_ctx.max_group_width, len(exc.exceptions))
+
+                if repeat_counts is not None:
+                    remaining = num_excs - sum(repeat_counts[:width])
+                else:
+                    remaining = num_excs - width
+
+                n = width + 1 if remaining > 0 else width
                 _ctx.need_close = False
                 for i in range(n):
                     last_exc = i == n - 1
@@ -275,11 +508,11 @@ class PatchedTracebackException(traceback.TracebackException):
                         # The closing frame may be added by a recursive call
                         _ctx.need_close = True
 
-                    if max_group_width is not None:
-                        truncated = i >= max_group_width
-                    else:
-                        truncated = False
+                    truncated = i >= width
                     title = f"{i + 1}" if not truncated else "..."
+                    if not truncated and repeat_counts and repeat_counts[i] > 1:
+                        title += f" ({repeat_counts[i]} identical exceptions)"
+
                     yield (
                         _ctx.indent()
                         + ("+-" if i == 0 else "  ")
@@ -289,7 +522,6 @@ class PatchedTracebackException(traceback.TracebackException):
                     if not truncated:
                         yield from exc.exceptions[i].format(chain=chain, _ctx=_ctx)
                     else:
-                        remaining = num_excs - max_group_width
                         plural = "s" if remaining > 1 else ""
                         yield from _ctx.emit(
                             f"and {remaining} more exception{plural}\n"
@@ -415,12 +647,29 @@ def _(__exc: type, value: BaseException, **kwargs: Any) -> List[str]:
 
 @singledispatch
 def format_exception(
-    __exc: BaseException, limit: Optional[int] = None, chain: bool = True, **kwargs: Any
+    __exc: BaseException,
+    limit: Optional[int] = None,
+    chain: bool = True,
+    *,
+    max_group_width: Optional[int] = None,
+    max_group_depth: Optional[int] = None,
+    max_lines: Optional[int] = None,
+    defer_stack: bool = False,
+    collapse_identical: bool = False,
+    **kwargs: Any,
 ) -> List[str]:
     return list(
         PatchedTracebackException(
-            type(__exc), __exc, __exc.__traceback__, limit=limit, compact=True
-        ).format(chain=chain)
+            type(__exc),
+            __exc,
+            __exc.__traceback__,
+            limit=limit,
+            compact=True,
+            max_group_width=max_group_width,
+            max_group_depth=max_group_depth,
+            defer_stack=defer_stack,
+            collapse_identical=collapse_identical,
+        ).format(chain=chain, max_lines=max_lines)
     )
 
 
@@ -433,7 +682,7 @@ def _(
     chain: bool = True,
     **kwargs: Any,
 ) -> List[str]:
-    return format_exception(value, limit, chain)
+    return format_exception(value, limit, chain, **kwargs)
 
 
 @singledispatch
@@ -442,14 +691,27 @@ def print_exception(
     limit: Optional[int] = None,
     file: Any = None,
     chain: bool = True,
+    *,
+    max_group_width: Optional[int] = None,
+    max_group_depth: Optional[int] = None,
+    max_lines: Optional[int] = None,
+    defer_stack: bool = False,
+    collapse_identical: bool = False,
     **kwargs: Any,
 ) -> None:
     if file is None:
         file = sys.stderr
 
     for line in PatchedTracebackException(
-        type(__exc), __exc, __exc.__traceback__, limit=limit
-    ).format(chain=chain):
+        type(__exc),
+        __exc,
+        __exc.__traceback__,
+        limit=limit,
+        max_group_width=max_group_width,
+        max_group_depth=max_group_depth,
+        defer_stack=defer_stack,
+        collapse_identical=collapse_identical,
+    ).format(chain=chain, max_lines=max_lines):
         print(line, file=file, end="")
 
 
@@ -461,8 +723,9 @@ def _(
     limit: Optional[int] = None,
     file: Any = None,
     chain: bool = True,
+    **kwargs: Any,
 ) -> None:
-    print_exception(value, limit, file, chain)
+    print_exception(value, limit, file, chain, **kwargs)
 
 
 def print_exc(
@@ -0,0 +1,192 @@
+# Versions of format_exception() and print_exception() for Python 3.11 and later, where
+# the standard library formats exception groups, that add support for the formatting
+# limits
+from __future__ import annotations
+
+import sys
+import traceback
+from functools import singledispatch
+from types import TracebackType
+from typing import Any, Iterator, List, Optional
+
+from ._limits import _formatting_limits, _limit_lines
+
+
+def _format(
+    exc: BaseException,
+    tb: TracebackType | None,
+    limit: int | None,
+    chain: bool,
+    max_group_width: int | None,
+    max_group_depth: int | None,
+    max_lines: int | None,
+    kwargs: dict[str, Any],
+) -> Iterator[str]:
+    # Explicitly given limits take precedence over the ones set for the current
+    # context, which take precedence over the defaults of TracebackException
+    overrides = _formatting_limits.get()
+    group_limits: dict[str, Any] = {
+        name: overrides[name] if value is None else value
+        for name, value in (
+            ("max_group_width", max_group_width),
+            ("max_group_depth", max_group_depth),
+        )
+        if value is not None or name in overrides
+    }
+    if max_lines is None:
+        max_lines = overrides.get("max_lines")
+    elif max_lines < 1:
+        raise ValueError("max_lines must be at least 1")
+
+    lines: Iterator[str] = traceback.TracebackException(
+        type(exc), exc, tb, limit=limit, compact=True, **group_limits
+    ).format(chain=chain, **kwargs)
+    if max_lines is not None:
+        lines = _limit_lines(lines, max_lines)
+
+    return lines
+
+
+def _print(
+    exc: BaseException,
+    tb: TracebackType | None,
+    limit: int | None,
+    file: Any,
+    chain: bool,
+    max_group_width: int | None,
+    max_group_depth: int | None,
+    max_lines: int | None,
+    kwargs: dict[str, Any],
+) -> None:
+    if (
+        max_group_width is None
+        and max_group_depth is None
+        and max_lines is None
+        and not _formatting_limits.get()
+    ):
+        # Leave the printing to the standard library (which may also colorize the
+        # output) when there are no limits to apply
+        traceback.print_exception(
+            type(exc), exc, tb, limit=limit, file=file, chain=chain, **kwargs
+        )
+        return
+
+    if file is None:
+        file = sys.stderr
+
+    for line in _format(
+        exc, tb, limit, chain, max_group_width, max_group_depth, max_lines, kwargs
+    ):
+        print(line, file=file, end="")
+
+
+@singledispatch
+def format_exception(
+    __exc: BaseException,
+    limit: Optional[int] = None,
+    chain: bool = True,
+    *,
+    max_group_width: Optional[int] = None,
+    max_group_depth: Optional[int] = None,
+    max_lines: Optional[int] = None,
+    defer_stack: bool = False,
+    collapse_identical: bool = False,
+    **kwargs: Any,
+) -> List[str]:
+    return list(
+        _format(
+            __exc,
+            __exc.__traceback__,
+            limit,
+            chain,
+            max_group_width,
+            max_group_depth,
+            max_lines,
+            kwargs,
+        )
+    )
+
+
+@format_exception.register
+def _(
+    __exc: type,
+    value: BaseException,
+    tb: Optional[TracebackType],
+    limit: Optional[int] = None,
+    chain: bool = True,
+    *,
+    max_group_width: Optional[int] = None,
+    max_group_depth: Optional[int] = None,
+    max_lines: Optional[int] = None,
+    defer_stack: bool = False,
+    collapse_identical: bool = False,
+    **kwargs: Any,
+) -> List[str]:
+    return list(
+        _format(
+            value,
+            tb,
+            limit,
+            chain,
+            max_group_width,
+            max_group_depth,
+            max_lines,
+            kwargs,
+        )
+    )
+
+
+@singledispatch
+def print_exception(
+    __exc: BaseException,
+    limit: Optional[int] = None,
+    file: Any = None,
+    chain: bool = True,
+    *,
+    max_group_width: Optional[int] = None,
+    max_group_depth: Optional[int] = None,
+    max_lines: Optional[int] = None,
+    defer_stack: bool = False,
+    collapse_identical: bool = False,
+    **kwargs: Any,
+) -> None:
+    _print(
+        __exc,
+        __exc.__traceback__,
+        limit,
+        file,
+        chain,
+        max_group_width,
+        max_group_depth,
+        max_lines,
+        kwargs,
+    )
+
+
+@print_exception.register
+def _(
+    __exc: type,
+    value: BaseException,
+    tb: Optional[TracebackType],
+    limit: Optional[int] = None,
+    file: Any = None,
+    chain: bool = True,
+    *,
+    max_group_width: Optional[int] = None,
+    max_group_depth: Optional[int] = None,
+    max_lines: Optional[int] = None,
+    defer_stack: bool = False,
+    collapse_identical: bool = False,
+    **kwargs: Any,
+) -> None:
+    _print(
+        value,
+        tb,
+        limit,
+        file,
+        chain,
+        max_group_width,
+        max_group_depth,
+        max_lines,
+        kwargs,
+    )
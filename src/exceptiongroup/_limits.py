@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict
+
+_formatting_limits: ContextVar[Dict[str, int]] = ContextVar(
+    "_formatting_limits", default={}
+)
+
+
+@contextmanager
+def formatting_limits(
+    *,
+    max_group_width: int | None = None,
+    max_group_depth: int | None = None,
+    max_lines: int | None = None,
+) -> Iterator[None]:
+    """
+    Override the default exception group formatting limits in the current context.
+
+    The overrides apply to any formatting done by this library within the ``with``
+    block, in the current thread or asynchronous task, unless explicitly overridden
+    in the call that does the formatting. Limits left as ``None`` keep their current
+    values.
+
+    .. note:: On Python 3.11 and later, this only affects the ``format_exception()``
+        and ``print_exception()`` functions of this library, as exceptions are
+        otherwise formatted by the standard library.
+
+    :param max_group_width: the maximum number of exceptions to format in each
+        exception group
+    :param max_group_depth: the maximum nesting depth of exception groups to format
+    :param max_lines: the maximum number of lines to output when formatting an
+        exception (including the line noting that the output was truncated)
+    :raises ValueError: if ``max_lines`` is less than 1
+
+    """
+    if max_lines is not None and max_lines < 1:
+        raise ValueError("max_lines must be at least 1")
+
+    overrides = {
+        name: value
+        for name, value in (
+            ("max_group_width", max_group_width),
+            ("max_group_depth", max_group_depth),
+            ("max_lines", max_lines),
+        )
+        if value is not None
+    }
+    token = _formatting_limits.set({**_formatting_limits.get(), **overrides})
+    try:
+        yield
+    finally:
+        _formatting_limits.reset(token)
+
+
+def _limit_lines(chunks: Iterator[str], max_lines: int) -> Iterator[str]:
+    # Only let through chunks that leave room for the truncation notice, unless the
+    # chunk is the last one and fits in the budget on its own
+    used = 0
+    for chunk in chunks:
+        num_lines = chunk.count("\n")
+        if used + num_lines < max_lines:
+            used += num_lines
+            yield chunk
+        elif used + num_lines == max_lines and next(chunks, None) is None:
+            yield chunk
+            return
+        else:
+            yield f"... (output truncated, max_lines is {max_lines})\n"
+            return
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import sys
+import threading
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
+from ._utils import _iter_leaf_exceptions
+
+if sys.version_info < (3, 11):
+    from ._exceptions import BaseExceptionGroup
+
+_statistics: ExceptionStatistics | None = None
+
+
+def _qualified_name(handler: Callable[..., Any]) -> str:
+    # Callables without names of their own (like partials or callable instances) are
+    # identified by their type
+    if not hasattr(handler, "__qualname__"):
+        handler = type(handler)
+
+    return f"{getattr(handler, '__module__', None)}.{handler.__qualname__}"
+
+
+class ExceptionStatistics:
+    """
+    Counters collected by :func:`catch` and :func:`suppress` while statistics collection
+    is enabled.
+
+    Leaf exceptions that are still present in the exception raised out of the context
+    manager are counted as re-raised, and the rest as swallowed. Exceptions raised by
+    ``catch()`` handlers are not counted as leaves.
+
+    Handlers are identified by their fully qualified names (``module.qualname``), so
+    that handlers created anew on every use (like lambdas) don't each get their own
+    entries. Handlers with the same qualified name share their counters.
+
+    .. note:: On Python 3.12.1 and later, :func:`suppress` is the one from
+        :mod:`contextlib`, and is thus not instrumented.
+
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        #: the number of exceptions (naked or exception groups) that arrived at
+        #: ``catch()`` or ``suppress()``
+        self.exceptions: int = 0
+        #: a histogram of the number of leaf exceptions carried by those exceptions
+        self.leaf_counts: Counter[int] = Counter()
+        #: the number of calls made to each ``catch()`` handler, by qualified name
+        self.handler_calls: Counter[str] = Counter()
+        #: the total wall clock time (in seconds) spent in each ``catch()`` handler, by
+        #: qualified name
+        self.handler_time: dict[str, float] = {}
+        #: the number of leaf exceptions swallowed, per exception type
+        self.swallowed: Counter[type[BaseException]] = Counter()
+        #: the number of leaf exceptions re-raised, per exception type
+        self.reraised: Counter[type[BaseException]] = Counter()
+
+    def record_handler_call(self, handler: Callable[..., Any], elapsed: float) -> None:
+        name = _qualified_name(handler)
+        with self._lock:
+            self.handler_calls[name] += 1
+            self.handler_time[name] = self.handler_time.get(name, 0.0) + elapsed
+
+    def record_outcome(
+        self, exc: BaseException, unhandled: BaseException | None
+    ) -> None:
+        leaves: list[BaseException]
+        if isinstance(exc, BaseExceptionGroup):
+            leaves = list(_iter_leaf_exceptions(exc))
+        else:
+            leaves = [exc]
+
+        remaining: set[int] = set()
+        if isinstance(unhandled, BaseExceptionGroup):
+            remaining.update(map(id, _iter_leaf_exceptions(unhandled)))
+        elif unhandled is not None:
+            remaining.add(id(unhandled))
+
+        with self._lock:
+            self.exceptions += 1
+            self.leaf_counts[len(leaves)] += 1
+            for leaf in leaves:
+                if id(leaf) in remaining:
+                    self.reraised[type(leaf)] += 1
+                else:
+                    self.swallowed[type(leaf)] += 1
+
+
+def enable_statistics() -> ExceptionStatistics:
+    """
+    Start collecting statistics from :func:`catch` and :func:`suppress`.
+
+    Until this is called, the only cost of the instrumentation is a single ``None``
+    check per exception arriving at either of them.
+
+    :return: the registry the statistics are collected into (the existing one if
+        statistics collection was already enabled)
+
+    """
+    global _statistics
+    if _statistics is None:
+        _statistics = ExceptionStatistics()
+
+    return _statistics
+
+
+def disable_statistics() -> None:
+    """Stop collecting statistics and discard the current registry."""
+    global _statistics
+    _statistics = None
+
+
+def get_statistics() -> ExceptionStatistics | None:
+    """
+    Return the registry statistics are currently being collected into.
+
+    :return: the registry, or ``None`` if statistics collection is not enabled
+
+    """
+    return _statistics
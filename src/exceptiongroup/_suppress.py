@@ -5,6 +5,9 @@ from contextlib import AbstractContextManager
 from types import TracebackType
 from typing import TYPE_CHECKING, Optional, Type, cast
 
+from . import _stats
+from ._exceptions import _copy_group, _TypeMatcher, get_condition_filter
+
 if sys.version_info < (3, 11):
     from ._exceptions import BaseExceptionGroup
 
@@ -20,6 +23,7 @@ class suppress(BaseClass):
 
     def __init__(self, *exceptions: type[BaseException]):
         self._exceptions = exceptions
+        self._matcher: _TypeMatcher | None = None
 
     def __enter__(self) -> None:
         pass
@@ -42,14 +46,69 @@ class suppress(BaseClass):
         if exctype is None:
             return False
 
+        stats = _stats._statistics
         if issubclass(exctype, self._exceptions):
+            if stats is not None:
+                stats.record_outcome(cast(BaseException, excinst), None)
+
             return True
 
         if issubclass(exctype, BaseExceptionGroup):
-            match, rest = cast(BaseExceptionGroup, excinst).split(self._exceptions)
+            excgroup = cast(BaseExceptionGroup, excinst)
+            verdict = self._classify(excgroup)
+            if verdict is None:
+                match, rest = excgroup.split(self._exceptions)
+            elif verdict:
+                rest = None
+            else:
+                # Nothing would be split off, so skip straight to the copy that
+                # split() would have produced
+                rest = _copy_group(excgroup)
+
+            if stats is not None:
+                stats.record_outcome(excgroup, rest)
+
             if rest is None:
                 return True
 
             raise rest
 
+        if stats is not None:
+            stats.record_outcome(cast(BaseException, excinst), excinst)
+
         return False
+
+    def _classify(self, group: BaseExceptionGroup) -> bool | None:
+        """
+        Check the nested exceptions of the given group against the suppressed types.
+
+        :return: ``True`` if everything in the group would be suppressed, ``False`` if
+            nothing would be, or ``None`` if the group needs to be split
+
+        """
+        # Match the nested exceptions by their MRO, like split() does, using the
+        # matcher's cached verdicts for each exception class
+        if self._matcher is None:
+            self._matcher = cast(_TypeMatcher, get_condition_filter(self._exceptions))
+
+        matches_class = self._matcher.matches_class
+        any_suppressed = False
+        all_suppressed = True
+        stack = [iter(group.exceptions)]
+        while stack:
+            for exc in stack[-1]:
+                if matches_class(type(exc)):
+                    # A matching nested group is suppressed as a whole
+                    any_suppressed = True
+                elif isinstance(exc, BaseExceptionGroup):
+                    stack.append(iter(exc.exceptions))
+                    break
+                else:
+                    all_suppressed = False
+
+                if any_suppressed and not all_suppressed:
+                    return None
+            else:
+                del stack[-1]
+
+        return any_suppressed
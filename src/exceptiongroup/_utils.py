@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from inspect import isclass
+from itertools import compress
+from operator import not_
+from typing import TYPE_CHECKING, Any, Tuple, Type, TypeVar, Union, cast
+
+from ._exceptions import (
+    _copy_group,
+    _derive_and_copy_attributes,
+    _is_same_sequence,
+    _LeafOnlyCondition,
+    get_condition_filter,
+)
+
+if sys.version_info < (3, 11):
+    from ._exceptions import BaseExceptionGroup
+
+if TYPE_CHECKING:
+    _Condition = Union[
+        Type[BaseException],
+        Tuple[Type[BaseException], ...],
+        Callable[[BaseException], bool],
+    ]
+
+_BaseExceptionT = TypeVar("_BaseExceptionT", bound=BaseException)
+
+
+def leaf_only(__predicate: _Condition) -> Callable[[BaseException], bool]:
+    """
+    Wrap a predicate so that it's only called on leaf exceptions.
+
+    When passed to :meth:`~BaseExceptionGroup.split`,
+    :meth:`~BaseExceptionGroup.subgroup` or :func:`partition`, the wrapped predicate is
+    never called on the exception group itself or any nested exception groups, which
+    never match.
+
+    An exception type or a tuple of exception types can also be given, in which case
+    leaf exceptions are matched against them like ``split()`` would.
+
+    :param __predicate: a callable that takes a (non-group) exception and returns
+        ``True`` if it matches, an exception type or a tuple of exception types
+    :return: the wrapped predicate
+
+    """
+    if isinstance(__predicate, tuple) or (
+        isclass(__predicate) and issubclass(__predicate, BaseException)
+    ):
+        # Exception types must not be called, but matched against
+        __predicate = get_condition_filter(__predicate)
+    elif not callable(__predicate):
+        raise TypeError("the predicate must be callable")
+
+    if sys.version_info < (3, 11):
+        # The backported split() recognizes these and skips over groups on its own
+        return _LeafOnlyCondition(__predicate)
+
+    # The built-in split() only accepts plain functions as predicates
+    def condition(exc: BaseException) -> bool:
+        return not isinstance(exc, BaseExceptionGroup) and __predicate(exc)
+
+    return condition
+
+
+def _first_match(
+    filters: list[Callable[[BaseException], bool]], exc: BaseException, limit: int
+) -> int:
+    for index in range(limit):
+        if filters[index](exc):
+            return index
+
+    return limit
+
+
+def partition(
+    __group: BaseExceptionGroup[_BaseExceptionT],
+    __conditions: Iterable[_Condition],
+) -> list[BaseExceptionGroup[_BaseExceptionT] | None]:
+    """
+    Split an exception group into several parts in a single pass.
+
+    This is the equivalent of calling :meth:`~BaseExceptionGroup.split` repeatedly,
+    once per condition, on the remainder of the previous split. Each exception ends up
+    in the part of the first condition it matches. Like with ``split()``, conditions
+    are also checked against nested exception groups, which are then assigned
+    wholesale to the first condition they match (barring any exceptions within them
+    matching an earlier condition).
+
+    Nested groups whose contents all end up in the same part are reused as-is instead
+    of being re-derived.
+
+    :param __group: the exception group to partition
+    :param __conditions: an iterable of exception types, tuples of exception types or
+        predicate callables
+    :return: a list containing the part matching each condition (or ``None`` if there
+        were no matches), followed by the part containing the exceptions that did not
+        match any condition
+
+    """
+    filters = [get_condition_filter(condition) for condition in __conditions]
+    parts: list[Any] = [None] * (len(filters) + 1)
+    index = _first_match(filters, __group, len(filters))
+    if index == 0:
+        parts[index] = __group
+        return parts
+
+    # Each frame on the stack holds: the group being processed, an iterator over its
+    # nested exceptions, the number of conditions eligible to claim exceptions within
+    # it, the index of the part receiving anything left unclaimed and the nested
+    # exceptions collected so far for each part
+    buckets: dict[int, list[BaseException]] = {}
+    stack = [(__group, iter(__group.exceptions), index, index, buckets)]
+    while stack:
+        group, iterator, limit, leftover, buckets = stack[-1]
+        for exc in iterator:
+            index = _first_match(filters, exc, limit)
+            if isinstance(exc, BaseExceptionGroup):
+                if index < limit:
+                    # The group itself matched, so only earlier conditions can
+                    # claim exceptions from within it
+                    sub_limit = sub_leftover = index
+                else:
+                    sub_limit, sub_leftover = limit, leftover
+
+                if sub_limit:
+                    stack.append(
+                        (exc, iter(exc.exceptions), sub_limit, sub_leftover, {})
+                    )
+                    break
+
+                # Nothing within this group can be claimed by an earlier condition
+                buckets.setdefault(sub_leftover, []).append(exc)
+            else:
+                bucket = index if index < limit else leftover
+                buckets.setdefault(bucket, []).append(exc)
+        else:
+            del stack[-1]
+            if stack:
+                parent_buckets = stack[-1][4]
+                exceptions = group.exceptions
+                for bucket, excs in buckets.items():
+                    if _is_same_sequence(excs, exceptions):
+                        # This part contains the entire group, so it can be reused
+                        parent_buckets.setdefault(bucket, []).append(group)
+                    else:
+                        derived = _derive_and_copy_attributes(group, excs)
+                        parent_buckets.setdefault(bucket, []).append(derived)
+            else:
+                for bucket, excs in buckets.items():
+                    parts[bucket] = _derive_and_copy_attributes(group, excs)
+
+    return parts
+
+
+def batch_split(
+    __group: BaseExceptionGroup[_BaseExceptionT],
+    __predicate: Callable[[list[_BaseExceptionT]], Sequence[Any]],
+) -> tuple[
+    BaseExceptionGroup[_BaseExceptionT] | None,
+    BaseExceptionGroup[_BaseExceptionT] | None,
+]:
+    """
+    Split an exception group by classifying all of its leaf exceptions at once.
+
+    Instead of being called once per exception like a ``split()`` predicate, the
+    predicate is called just once, with a list of all the leaf exceptions (depth first,
+    as yielded by :func:`iter_leaves`). It must return a sequence of the same length,
+    with a truthy item for each matching exception. Any sequence goes, including a NumPy
+    boolean array, which makes vectorized classification possible.
+
+    Like with :func:`leaf_only`, the nested exception groups are never classified
+    themselves. Nested groups whose exceptions all end up on the same side are reused
+    as-is.
+
+    :param __group: the exception group to split
+    :param __predicate: a callable that takes a list of exceptions and returns a
+        sequence of booleans
+    :return: a tuple of (matching exceptions, non-matching exceptions), either of which
+        is ``None`` if it would be empty
+    :raises ValueError: if the predicate returned the wrong number of items
+
+    """
+    # Gather the leaves, taking note of the groups that contain nothing but leaves so
+    # that they can be split in bulk
+    leaves: list[BaseException] = []
+    flat_groups: set[int] = set()
+    stack: list[Iterator[BaseException]] = [iter((__group,))]
+    while stack:
+        for exc in stack[-1]:
+            if not isinstance(exc, BaseExceptionGroup):
+                leaves.append(exc)
+            elif any(
+                issubclass(cls, BaseExceptionGroup)
+                for cls in set(map(type, exc.exceptions))
+            ):
+                stack.append(iter(exc.exceptions))
+                break
+            else:
+                flat_groups.add(id(exc))
+                leaves.extend(exc.exceptions)
+        else:
+            del stack[-1]
+
+    verdicts = __predicate(cast("list[_BaseExceptionT]", leaves))
+    if len(verdicts) != len(leaves):
+        raise ValueError(
+            f"the predicate returned {len(verdicts)} items for {len(leaves)} exceptions"
+        )
+
+    # Rebuild the tree from the verdicts, visiting the exceptions in the same order as
+    # above, starting from a virtual root group containing the actual one
+    verdicts = list(verdicts)
+    position = 0
+    matching: list[BaseException] = []
+    nonmatching: list[BaseException] = []
+    rebuild_stack = [(__group, iter((__group,)), matching, nonmatching)]
+    while True:
+        group, iterator, group_matching, group_nonmatching = rebuild_stack[-1]
+        for exc in iterator:
+            if not isinstance(exc, BaseExceptionGroup):
+                if verdicts[position]:
+                    group_matching.append(exc)
+                else:
+                    group_nonmatching.append(exc)
+
+                position += 1
+            elif id(exc) in flat_groups:
+                exceptions = exc.exceptions
+                subgroup_verdicts = verdicts[position : position + len(exceptions)]
+                position += len(exceptions)
+                if all(subgroup_verdicts):
+                    group_matching.append(exc)
+                elif not any(subgroup_verdicts):
+                    group_nonmatching.append(exc)
+                else:
+                    group_matching.append(
+                        _derive_and_copy_attributes(
+                            exc, list(compress(exceptions, subgroup_verdicts))
+                        )
+                    )
+                    group_nonmatching.append(
+                        _derive_and_copy_attributes(
+                            exc,
+                            list(compress(exceptions, map(not_, subgroup_verdicts))),
+                        )
+                    )
+            else:
+                rebuild_stack.append((exc, iter(exc.exceptions), [], []))
+                break
+        else:
+            del rebuild_stack[-1]
+            if not rebuild_stack:
+                break
+
+            # Reuse nested groups that end up entirely on one side
+            _, _, parent_matching, parent_nonmatching = rebuild_stack[-1]
+            if not group_nonmatching:
+                parent_matching.append(group)
+            elif not group_matching:
+                parent_nonmatching.append(group)
+            else:
+                parent_matching.append(
+                    _derive_and_copy_attributes(group, group_matching)
+                )
+                parent_nonmatching.append(
+                    _derive_and_copy_attributes(group, group_nonmatching)
+                )
+
+    # Like split(), always return new groups at the top level
+    parts: list[Any] = []
+    for part in (matching, nonmatching):
+        if not part:
+            parts.append(None)
+        elif part[0] is __group:
+            parts.append(_copy_group(__group))
+        else:
+            parts.append(part[0])
+
+    return parts[0], parts[1]
+
+
+def _iter_leaf_exceptions(group: BaseExceptionGroup[Any]) -> Iterator[BaseException]:
+    stack = [iter(group.exceptions)]
+    while stack:
+        for exc in stack[-1]:
+            if isinstance(exc, BaseExceptionGroup):
+                stack.append(iter(exc.exceptions))
+                break
+
+            yield exc
+        else:
+            del stack[-1]
+
+
+def iter_leaves(
+    __group: BaseExceptionGroup[_BaseExceptionT],
+) -> Iterator[tuple[tuple[int, ...], _BaseExceptionT]]:
+    """
+    Iterate over the leaf exceptions in an exception group, depth first.
+
+    No new exception groups are created in the process.
+
+    :param __group: the exception group to walk through
+    :return: an iterator yielding tuples of (path, exception), where ``path`` is a tuple
+        of the indexes leading to the exception through the ``exceptions`` of each
+        group along the way
+
+    """
+    path: list[int] = []
+    stack = [enumerate(__group.exceptions)]
+    while stack:
+        for index, exc in stack[-1]:
+            if isinstance(exc, BaseExceptionGroup):
+                path.append(index)
+                stack.append(enumerate(exc.exceptions))
+                break
+
+            yield (*path, index), exc
+        else:
+            del stack[-1]
+            if path:
+                path.pop()
+
+
+def contains_leaf(__group: BaseExceptionGroup[Any], __condition: _Condition) -> bool:
+    """
+    Check if any leaf exception in the exception group matches the given condition.
+
+    Unlike with :meth:`~BaseExceptionGroup.split`, the condition is only checked against
+    leaf exceptions, and the search stops at the first match.
+
+    :param __group: the exception group to search
+    :param __condition: an exception type, a tuple of exception types or a predicate
+        callable
+    :return: ``True`` if a matching exception was found, ``False`` otherwise
+
+    """
+    return find_leaf(__group, __condition) is not None
+
+
+def count_leaves(
+    __group: BaseExceptionGroup[Any], __condition: _Condition | None = None
+) -> int:
+    """
+    Count the leaf exceptions in the exception group.
+
+    :param __group: the exception group to search
+    :param __condition: an exception type, a tuple of exception types or a predicate
+        callable to only count matching exceptions
+    :return: the number of (matching) leaf exceptions
+
+    """
+    if __condition is None:
+        return sum(1 for _ in _iter_leaf_exceptions(__group))
+
+    condition = get_condition_filter(__condition)
+    return sum(1 for exc in _iter_leaf_exceptions(__group) if condition(exc))
+
+
+def find_leaf(
+    __group: BaseExceptionGroup[Any], __condition: _Condition
+) -> BaseException | None:
+    """
+    Find the first leaf exception in the exception group matching the given condition.
+
+    The exceptions are searched depth first.
+
+    :param __group: the exception group to search
+    :param __condition: an exception type, a tuple of exception types or a predicate
+        callable
+    :return: the first matching exception, or ``None`` if there was no match
+
+    """
+    condition = get_condition_filter(__condition)
+    for exc in _iter_leaf_exceptions(__group):
+        if condition(exc):
+            return exc
+
+    return None
@@ -37,5 +37,14 @@ with catch(
     ...
 
 
+async def report_value_errors(excgroup: BaseExceptionGroup) -> None:
+    print("Caught value errors")
+
+
+async def async_catch() -> None:
+    async with catch({ValueError: report_value_errors}):
+        ...
+
+
 with suppress(RuntimeError):
     raise ExceptionGroup("", [RuntimeError("boo")])
@@ -1,4 +1,21 @@
 import sys
 
+import pytest
+
 if sys.version_info < (3, 11):
+    from exceptiongroup import ExceptionGroup
+
     collect_ignore_glob = ["*_py311.py"]
+
+
+class SortingGroup(ExceptionGroup):
+    """An exception group whose ``derive()`` sorts the list of exceptions it's given."""
+
+    def derive(self, excs):
+        excs.sort(key=str)
+        return SortingGroup(self.message, excs)
+
+
+@pytest.fixture
+def sorting_group():
+    return SortingGroup
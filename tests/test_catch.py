@@ -1,3 +1,8 @@
+import asyncio
+import sys
+import threading
+from traceback import extract_tb
+
 import pytest
 
 from exceptiongroup import BaseExceptionGroup, ExceptionGroup, catch
@@ -58,6 +63,24 @@ def test_catch_ungrouped():
     assert len(zero_division_errors[0].exceptions) == 1
 
 
+def test_catch_ungrouped_first_match_only():
+    lookup_errors = []
+    base_exceptions = []
+    with catch(
+        {
+            (KeyboardInterrupt, LookupError): lookup_errors.append,
+            BaseException: base_exceptions.append,
+        }
+    ):
+        raise KeyboardInterrupt
+
+    assert not base_exceptions
+    assert len(lookup_errors) == 1
+    assert type(lookup_errors[0]) is BaseExceptionGroup
+    assert lookup_errors[0].message == ""
+    assert isinstance(lookup_errors[0].exceptions[0], KeyboardInterrupt)
+
+
 def test_catch_group():
     value_runtime_errors = []
     zero_division_errors = []
@@ -129,6 +152,51 @@ def test_catch_no_match():
         pytest.fail("Did not raise an ExceptionGroup")
 
 
+def test_catch_no_match_nested():
+    def handler(eg):
+        pytest.fail("Handler should not have been called")
+
+    class MixedInGroup(ExceptionGroup, RuntimeError):
+        pass
+
+    try:
+        with catch({(ValueError, RuntimeError): handler}):
+            group = ExceptionGroup(
+                "booboo", [ZeroDivisionError(), ExceptionGroup("nested", [KeyError()])]
+            )
+            raise group
+    except ExceptionGroup as exc:
+        assert exc is not group
+        assert exc.exceptions == group.exceptions
+    else:
+        pytest.fail("Did not raise an ExceptionGroup")
+
+    # The nested groups themselves may match too
+    runtime_errors = []
+    with catch({RuntimeError: runtime_errors.append}):
+        raise ExceptionGroup("booboo", [MixedInGroup("nested", [KeyError()])])
+
+    assert len(runtime_errors) == 1
+    assert isinstance(runtime_errors[0].exceptions[0], MixedInGroup)
+
+
+def test_catch_no_match_derive_gets_list(sorting_group):
+    with pytest.raises(sorting_group) as exc:
+        with catch({KeyError: lambda eg: None}):
+            raise sorting_group("booboo", [ValueError("b"), ValueError("a")])
+
+    assert [str(e) for e in exc.value.exceptions] == ["a", "b"]
+
+
+def test_catch_no_handlers():
+    group = ExceptionGroup("booboo", [ValueError()])
+    with pytest.raises(ExceptionGroup) as exc:
+        with catch({}):
+            raise group
+
+    assert exc.value is group
+
+
 def test_catch_single_no_match():
     try:
         with catch({(ValueError, RuntimeError): (lambda e: None)}):
@@ -185,6 +253,21 @@ def test_bare_raise_in_handler():
     assert excgrp.value.__context__ is first_exc
 
 
+def test_handler_exc_info():
+    def handler(eg):
+        exc_info.extend(sys.exc_info())
+
+    exc_info = []
+    with catch({ValueError: handler}):
+        raise ExceptionGroup("booboo", [ValueError("bar")])
+
+    etype, value, tb = exc_info
+    assert etype is ExceptionGroup
+    assert isinstance(value.exceptions[0], ValueError)
+    assert tb is value.__traceback__
+    assert extract_tb(tb)[-1].name == "test_handler_exc_info"
+
+
 def test_catch_subclass():
     lookup_errors = []
     with catch({LookupError: lookup_errors.append}):
@@ -210,6 +293,133 @@ def test_async_handler(request):
             raise ExceptionGroup("message", [TypeError("uh-oh")])
 
 
+def test_catch_per_leaf():
+    value_errors = []
+    key_errors = []
+    with pytest.raises(ExceptionGroup) as exc:
+        with catch(
+            {ValueError: value_errors.append, KeyError: key_errors.append},
+            per_leaf=True,
+        ):
+            raise ExceptionGroup(
+                "booboo",
+                [
+                    ValueError("foo"),
+                    ExceptionGroup("nested", [KeyError("bar"), ZeroDivisionError()]),
+                    ValueError("baz"),
+                    ExceptionGroup("untouched", [RuntimeError()]),
+                ],
+            )
+
+    assert [str(exc) for exc in value_errors] == ["foo", "baz"]
+    assert [str(exc) for exc in key_errors] == ["'bar'"]
+    assert str(exc.value) == "booboo (2 sub-exceptions)"
+    nested, untouched = exc.value.exceptions
+    assert str(nested) == "nested (1 sub-exception)"
+    assert isinstance(nested.exceptions[0], ZeroDivisionError)
+    assert str(untouched) == "untouched (1 sub-exception)"
+    assert isinstance(untouched.exceptions[0], RuntimeError)
+
+
+def test_catch_per_leaf_ungrouped():
+    value_errors = []
+    with catch({ValueError: value_errors.append}, per_leaf=True):
+        raise ValueError("foo")
+
+    assert len(value_errors) == 1
+    assert str(value_errors[0]) == "foo"
+
+
+def test_catch_per_leaf_no_match():
+    with pytest.raises(ExceptionGroup) as exc:
+        with catch({ValueError: lambda exc: None}, per_leaf=True):
+            group = ExceptionGroup("booboo", [ZeroDivisionError()])
+            raise group
+
+    assert exc.value is not group
+    assert exc.value.exceptions == group.exceptions
+
+
+def test_catch_per_leaf_handler_raises():
+    def handler(exc):
+        if str(exc) == "reraise":
+            raise
+
+        raise RuntimeError(str(exc))
+
+    with pytest.raises(ExceptionGroup) as exc:
+        with catch({ValueError: handler}, per_leaf=True):
+            raise ExceptionGroup("booboo", [ValueError("foo"), ValueError("reraise")])
+
+    assert len(exc.value.exceptions) == 2
+    new_exc, reraised = exc.value.exceptions
+    assert isinstance(new_exc, RuntimeError)
+    assert str(new_exc) == "foo"
+    assert isinstance(reraised, ValueError)
+    assert str(reraised) == "reraise"
+
+
+def test_async_catch():
+    async def value_handler(eg):
+        await asyncio.sleep(0)
+        caught.append(("value", eg, sys.exc_info()[1]))
+
+    def key_handler(eg):
+        caught.append(("key", eg, sys.exc_info()[1]))
+
+    async def main():
+        async with catch({ValueError: value_handler, KeyError: key_handler}):
+            raise ExceptionGroup(
+                "booboo", [KeyError(), ValueError(), ZeroDivisionError()]
+            )
+
+    caught = []
+    with pytest.raises(ExceptionGroup) as exc:
+        asyncio.run(main())
+
+    assert len(exc.value.exceptions) == 1
+    assert isinstance(exc.value.exceptions[0], ZeroDivisionError)
+    assert [name for name, _, _ in caught] == ["value", "key"]
+    for _, eg, handled in caught:
+        assert handled is eg
+
+
+def test_async_catch_handler_raises():
+    async def handler(eg):
+        await asyncio.sleep(0)
+        raise RuntimeError("new")
+
+    async def main():
+        async with catch({(ValueError, ValueError): handler}):
+            excgrp = ExceptionGroup("booboo", [ValueError("bar")])
+            raise excgrp
+
+    with pytest.raises(RuntimeError, match="new") as exc:
+        asyncio.run(main())
+
+    context = exc.value.__context__
+    assert isinstance(context, ExceptionGroup)
+    assert str(context) == "booboo (1 sub-exception)"
+    assert len(context.exceptions) == 1
+    assert isinstance(context.exceptions[0], ValueError)
+    assert exc.value.__cause__ is None
+
+
+def test_async_catch_bare_raise():
+    async def handler(eg):
+        raise
+
+    async def main():
+        async with catch({KeyError: handler}):
+            raise KeyError("foo")
+
+    with pytest.raises(ExceptionGroup) as exc:
+        asyncio.run(main())
+
+    assert len(exc.value.exceptions) == 1
+    assert isinstance(exc.value.exceptions[0], KeyError)
+
+
 def test_bare_reraise_from_naked_exception():
     def handler(eg):
         raise
@@ -220,3 +430,49 @@ def test_bare_reraise_from_naked_exception():
     assert len(excgrp.value.exceptions) == 1
     assert isinstance(excgrp.value.exceptions[0], KeyError)
     assert str(excgrp.value.exceptions[0]) == "'foo'"
+
+
+def test_reuse_catcher():
+    value_errors = []
+    catcher = catch({ValueError: value_errors.append})
+    for i in range(3):
+        with catcher:
+            raise ExceptionGroup("booboo", [ValueError(i)])
+
+    with catcher:
+        pass
+
+    assert [str(eg.exceptions[0]) for eg in value_errors] == ["0", "1", "2"]
+
+
+def test_reuse_catcher_nested():
+    caught = []
+    catcher = catch({ValueError: caught.append})
+    with catcher:
+        with catcher:
+            raise ExceptionGroup("inner", [ValueError("inner")])
+
+        raise ExceptionGroup("outer", [ValueError("outer")])
+
+    assert [str(eg.exceptions[0]) for eg in caught] == ["inner", "outer"]
+
+
+def test_reuse_catcher_threads():
+    caught = []
+    catcher = catch({ValueError: caught.append})
+
+    def worker(i):
+        for j in range(100):
+            with catcher:
+                raise ExceptionGroup("booboo", [ValueError(i, j)])
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert sorted(eg.exceptions[0].args for eg in caught) == [
+        (i, j) for i in range(4) for j in range(100)
+    ]
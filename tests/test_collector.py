@@ -0,0 +1,62 @@
+import pytest
+
+from exceptiongroup import BaseExceptionGroup, ExceptionCollector, ExceptionGroup
+
+
+def test_empty():
+    collector = ExceptionCollector()
+    assert len(collector) == 0
+    assert collector.build("foo") is None
+
+
+def test_unbounded():
+    collector = ExceptionCollector()
+    exceptions = [ValueError(i) for i in range(100)]
+    for exc in exceptions:
+        collector.add(exc)
+
+    group = collector.build("foo")
+    assert type(group) is ExceptionGroup
+    assert group.message == "foo"
+    assert list(group.exceptions) == exceptions
+    assert not hasattr(group, "__notes__")
+    assert len(collector) == 100
+    assert not collector.dropped
+
+
+def test_bounded():
+    collector = ExceptionCollector(max_exceptions=2)
+    exceptions = [ValueError(1), KeyboardInterrupt()]
+    for exc in exceptions:
+        collector.add(exc)
+
+    for _ in range(3):
+        collector.add(KeyError())
+
+    collector.add(ValueError(2))
+    assert len(collector) == 6
+    assert collector.exceptions == tuple(exceptions)
+    assert collector.dropped == {KeyError: 3, ValueError: 1}
+
+    group = collector.build("foo")
+    assert type(group) is BaseExceptionGroup
+    assert list(group.exceptions) == exceptions
+    assert group.__notes__ == ["4 more exceptions dropped (KeyError: 3, ValueError: 1)"]
+
+
+def test_build_is_not_affected_by_later_additions():
+    collector = ExceptionCollector()
+    collector.add(ValueError(1))
+    group = collector.build("foo")
+    collector.add(ValueError(2))
+    assert repr(group) == "ExceptionGroup('foo', [ValueError(1)])"
+
+
+def test_add_non_exception():
+    with pytest.raises(TypeError, match="expected an exception, got str instead"):
+        ExceptionCollector().add("foo")
+
+
+def test_invalid_max_exceptions():
+    with pytest.raises(ValueError, match="max_exceptions must be at least 1"):
+        ExceptionCollector(max_exceptions=0)
@@ -7,6 +7,7 @@ import unittest
 import pytest
 
 from exceptiongroup import BaseExceptionGroup, ExceptionGroup
+from exceptiongroup._exceptions import get_condition_filter
 
 
 class TestExceptionGroupTypeHierarchy(unittest.TestCase):
@@ -371,6 +372,9 @@ class ExceptionGroupSplitTests(ExceptionGroupTestBase):
                 self.assertMatchesTemplate(rest, ExceptionGroup, rest_template)
 
 
+@pytest.mark.skipif(
+    sys.version_info < (3, 11), reason="The backport splits groups without recursion"
+)
 class DeepRecursionInSplitAndSubgroup(unittest.TestCase):
     def make_deep_eg(self):
         e = TypeError(1)
@@ -389,6 +393,107 @@ class DeepRecursionInSplitAndSubgroup(unittest.TestCase):
             e.subgroup(TypeError)
 
 
+@pytest.mark.skipif(
+    sys.version_info >= (3, 11), reason="The built-in split() and subgroup() recurse"
+)
+class DeepSplitAndSubgroup(unittest.TestCase):
+    depth = 5000
+
+    def make_deep_eg(self):
+        e = ExceptionGroup("eg", [TypeError(1), ValueError(2)])
+        e.__cause__ = KeyError("cause")
+        for i in range(self.depth):
+            e = ExceptionGroup(f"eg{i}", [e, ValueError(i)])
+            e.add_note(f"note {i}")
+        return e
+
+    def assertDeepParts(self, eg, part, types):
+        for _ in range(self.depth):
+            self.assertEqual(part.message, eg.message)
+            self.assertIs(part.__traceback__, eg.__traceback__)
+            self.assertIs(part.__cause__, eg.__cause__)
+            self.assertEqual(part.__notes__, eg.__notes__)
+            self.assertIsNot(part.__notes__, eg.__notes__)
+            if types == (ValueError,):
+                self.assertEqual(len(part.exceptions), 2)
+                self.assertIs(part.exceptions[1], eg.exceptions[1])
+            else:
+                self.assertEqual(len(part.exceptions), 1)
+
+            eg = eg.exceptions[0]
+            part = part.exceptions[0]
+
+        self.assertIs(part.__cause__, eg.__cause__)
+        self.assertEqual(tuple(type(exc) for exc in part.exceptions), types)
+
+    def test_deep_split(self):
+        eg = self.make_deep_eg()
+        match, rest = eg.split(ValueError)
+        self.assertDeepParts(eg, match, (ValueError,))
+        self.assertDeepParts(eg, rest, (TypeError,))
+
+    def test_deep_subgroup(self):
+        eg = self.make_deep_eg()
+        self.assertIs(eg.subgroup(Exception), eg)
+        self.assertIs(eg.subgroup(lambda exc: not isinstance(exc, KeyError)), eg)
+        self.assertDeepParts(eg, eg.subgroup(ValueError), (ValueError,))
+        self.assertIsNone(eg.subgroup(KeyError))
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 11), reason="The built-in split() always derives groups"
+)
+def test_split_reuses_untouched_nested_groups():
+    matching_nested = ExceptionGroup("matching", [ValueError(1), ValueError(2)])
+    nonmatching_nested = ExceptionGroup("nonmatching", [TypeError(3)])
+    mixed_nested = ExceptionGroup("mixed", [ValueError(4), TypeError(5)])
+    eg = ExceptionGroup("root", [matching_nested, nonmatching_nested, mixed_nested])
+    match, rest = eg.split(ValueError)
+    assert match.exceptions[0] is matching_nested
+    assert rest.exceptions[0] is nonmatching_nested
+    assert match.exceptions[1] is not mixed_nested
+    assert match.exceptions[1].exceptions == (mixed_nested.exceptions[0],)
+    assert rest.exceptions[1] is not mixed_nested
+    assert rest.exceptions[1].exceptions == (mixed_nested.exceptions[1],)
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 11), reason="Only the backport caches nested types"
+)
+def test_split_by_type_uses_nested_types():
+    class MyExceptionGroup(ExceptionGroup):
+        pass
+
+    value_errors = ExceptionGroup("values", [ValueError(1), ValueError(2)])
+    type_errors = MyExceptionGroup("types", [TypeError(3)])
+    mixed = ExceptionGroup("mixed", [value_errors, type_errors, KeyError(4)])
+    eg = ExceptionGroup("root", [mixed, OSError(5)])
+    assert not hasattr(eg, "_nested_types")
+
+    first_match, first_rest = eg.split(ValueError)
+    assert eg._nested_types == {
+        ExceptionGroup,
+        MyExceptionGroup,
+        ValueError,
+        TypeError,
+        KeyError,
+        OSError,
+    }
+    assert value_errors._nested_types == {ValueError}
+
+    match, rest = eg.split(ValueError)
+    assert repr(match) == repr(first_match)
+    assert repr(rest) == repr(first_rest)
+    assert match.exceptions[0].exceptions == (value_errors,)
+
+    match, rest = eg.split(MyExceptionGroup)
+    assert match.exceptions[0].exceptions == (type_errors,)
+    assert rest.exceptions[0].exceptions == (value_errors, mixed.exceptions[2])
+
+    assert eg.subgroup((ValueError, TypeError, KeyError, OSError)) is eg
+    assert eg.subgroup(RuntimeError) is None
+
+
 def leaf_generator(exc, tbs=None):
     if tbs is None:
         tbs = []
@@ -886,3 +991,49 @@ def test_exceptions_mutate_original_sequence():
         "BaseExceptionGroup('foo', [ValueError(1), KeyboardInterrupt(), "
         "KeyError('bar')])"
     )
+
+
+def test_condition_filter_is_cached():
+    assert get_condition_filter(ValueError) is get_condition_filter(ValueError)
+    assert get_condition_filter((ValueError, KeyError)) is get_condition_filter(
+        (ValueError, KeyError)
+    )
+    assert get_condition_filter(ValueError) is not get_condition_filter(KeyError)
+
+
+def test_condition_filter_class_verdicts():
+    class MyValueError(ValueError):
+        pass
+
+    condition = get_condition_filter((ValueError, KeyboardInterrupt))
+    for _ in range(2):
+        assert condition(ValueError())
+        assert condition(MyValueError())
+        assert condition(KeyboardInterrupt())
+        assert not condition(KeyError())
+        assert not condition(ExceptionGroup("", [ValueError()]))
+
+
+def test_condition_filter_passes_through_callables():
+    def predicate(exc):
+        return True
+
+    assert get_condition_filter(predicate) is predicate
+    with pytest.raises(TypeError):
+        get_condition_filter(([OSError],))
+
+
+def test_non_exception_reported_before_base_exception():
+    with pytest.raises(ValueError, match=r"Item 2 of second argument \(exceptions\)"):
+        ExceptionGroup("eg", [ValueError(1), KeyboardInterrupt(), "not an exception"])
+
+
+def test_split_with_default_derive():
+    eg = BaseExceptionGroup("msg", [ValueError(1), KeyboardInterrupt()])
+    match, rest = eg.split(ValueError)
+    assert type(match) is ExceptionGroup
+    assert repr(match) == "ExceptionGroup('msg', [ValueError(1)])"
+    assert match.exceptions == (eg.exceptions[0],)
+    assert type(rest) is BaseExceptionGroup
+    assert repr(rest) == "BaseExceptionGroup('msg', [KeyboardInterrupt()])"
+    assert rest.exceptions == (eg.exceptions[1],)
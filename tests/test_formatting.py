@@ -3,7 +3,7 @@ import subprocess
 import sys
 import traceback
 from pathlib import Path
-from typing import NoReturn
+from typing import List, NoReturn
 from urllib.error import HTTPError
 
 import pytest
@@ -575,3 +575,314 @@ def test_works_around_httperror_bug():
     # See https://github.com/python/cpython/issues/98778 in Python <= 3.9
     err = HTTPError("url", 405, "METHOD NOT ALLOWED", None, None)
     traceback.TracebackException(type(err), err, None)
+
+
+class CountingError(Exception):
+    formatted = 0
+
+    def __str__(self) -> str:
+        CountingError.formatted += 1
+        return super().__str__()
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 11),
+    reason="No patching is done on Python >= 3.11",
+)
+def test_format_wide_group_captures_rendered_only() -> None:
+    from exceptiongroup import format_exception
+
+    CountingError.formatted = 0
+    group = ExceptionGroup("wide", [CountingError(i) for i in range(100)])
+    output = "".join(format_exception(group))
+    assert CountingError.formatted == 15
+    assert "CountingError: 14\n" in output
+    assert "CountingError: 15\n" not in output
+    assert "and 85 more exceptions\n" in output
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 11),
+    reason="No patching is done on Python >= 3.11",
+)
+def test_format_deep_group_captures_rendered_only() -> None:
+    from exceptiongroup import format_exception
+
+    CountingError.formatted = 0
+    group = ExceptionGroup("leaf", [CountingError("deepest")])
+    for level in range(12):
+        group = ExceptionGroup(f"level {level}", [group])
+
+    output = "".join(format_exception(group))
+    assert CountingError.formatted == 0
+    assert "... (max_group_depth is 10)\n" in output
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 11),
+    reason="No patching is done on Python >= 3.11",
+)
+def test_format_exception_defer_stack() -> None:
+    from exceptiongroup import format_exception
+
+    try:
+        raise_excgroup()
+    except ExceptionGroup as exc:
+        lines = format_exception(exc, defer_stack=True)
+        assert lines == format_exception(exc)
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 11),
+    reason="No patching is done on Python >= 3.11",
+)
+def test_defer_stack_extracts_on_access() -> None:
+    from exceptiongroup._formatting import PatchedTracebackException
+
+    try:
+        raise_excgroup()
+    except ExceptionGroup as exc:
+        tbe = PatchedTracebackException(
+            type(exc), exc, exc.__traceback__, defer_stack=True
+        )
+
+    assert "stack" not in tbe.__dict__
+    assert "stack" not in tbe.exceptions[0].__dict__
+    assert [frame.name for frame in tbe.stack] == [
+        "test_defer_stack_extracts_on_access",
+        "raise_excgroup",
+    ]
+    assert tbe.stack[1].line == "raise exc"
+    assert "stack" not in tbe.exceptions[0].__dict__
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 11),
+    reason="No patching is done on Python >= 3.11",
+)
+def test_frame_summaries_shared() -> None:
+    from exceptiongroup._formatting import PatchedTracebackException
+
+    def raise_value_error() -> NoReturn:
+        raise ValueError("foo")
+
+    exceptions = []
+    for _ in range(2):
+        try:
+            raise_value_error()
+        except ValueError as exc:
+            exceptions.append(exc)
+
+    group = ExceptionGroup("test message", exceptions)
+    tbe = PatchedTracebackException(type(group), group, None)
+    stack1, stack2 = (texc.stack for texc in tbe.exceptions)
+    expected = traceback.StackSummary.extract(
+        traceback.walk_tb(exceptions[0].__traceback__)
+    )
+    assert [(frame.name, frame.lineno, frame.line) for frame in stack1] == [
+        (frame.name, frame.lineno, frame.line) for frame in expected
+    ]
+    assert all(frame1 is frame2 for frame1, frame2 in zip(stack1, stack2))
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 11),
+    reason="No patching is done on Python >= 3.11",
+)
+def test_format_exception_collapse_identical() -> None:
+    from exceptiongroup import format_exception
+
+    def raise_exc(exc: Exception) -> NoReturn:
+        raise exc
+
+    exceptions: list[BaseException] = []
+    for i in range(40):
+        try:
+            raise_exc(ValueError("same") if i % 20 else KeyError(i))
+        except Exception as exc:
+            exceptions.append(exc)
+
+    # Exception groups are never collapsed
+    subgroups = [ExceptionGroup("sub", [ValueError("same")]) for _ in range(2)]
+    group = ExceptionGroup("test message", [*exceptions, *subgroups])
+    output = "".join(format_exception(group, collapse_identical=True))
+    assert output.count("ValueError: same\n") == 3
+    assert "+---------------- 2 (38 identical exceptions) ----------------\n" in output
+    assert "KeyError: 0\n" in output
+    assert "KeyError: 20\n" in output
+    assert "+---------------- 5 ----------------\n" in output
+    assert "more exception" not in output
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 11),
+    reason="No patching is done on Python >= 3.11",
+)
+def test_format_exception_collapse_identical_truncated() -> None:
+    from exceptiongroup import format_exception
+
+    exceptions = [ValueError(i % 20) for i in range(100)]
+    group = ExceptionGroup("test message", exceptions)
+    output = "".join(format_exception(group, collapse_identical=True))
+    assert "+---------------- 15 (5 identical exceptions) ----------------\n" in output
+    assert "and 25 more exceptions\n" in output
+
+
+def test_format_exception_group_limits() -> None:
+    from exceptiongroup import format_exception
+
+    group = ExceptionGroup(
+        "test message",
+        [ValueError(1), ExceptionGroup("nested", [ValueError(2)]), ValueError(3)],
+    )
+    output = "".join(format_exception(group, max_group_width=2, max_group_depth=1))
+    assert "ValueError: 1\n" in output
+    assert "... (max_group_depth is 1)\n" in output
+    assert "ValueError: 2\n" not in output
+    assert "ValueError: 3\n" not in output
+    assert "and 1 more exception\n" in output
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 11),
+    reason="No patching is done on Python >= 3.11",
+)
+def test_format_group_limits() -> None:
+    from exceptiongroup._formatting import PatchedTracebackException
+
+    group = ExceptionGroup("test message", [ValueError(i) for i in range(4)])
+    tbe = PatchedTracebackException(type(group), group, None)
+    output = "".join(tbe.format(max_group_width=2))
+    assert "and 2 more exceptions\n" in output
+    output = "".join(tbe.format())
+    assert "ValueError: 3\n" in output
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 11),
+    reason="No patching is done on Python >= 3.11",
+)
+def test_format_group_limits_beyond_capture() -> None:
+    from exceptiongroup._formatting import PatchedTracebackException
+
+    inner = ExceptionGroup("inner", [ValueError(1)])
+    mid = ExceptionGroup("mid", [inner])
+    group = ExceptionGroup("test message", [mid] + [ValueError(i) for i in range(20)])
+    tbe = PatchedTracebackException(type(group), group, None, max_group_depth=1)
+    output = "".join(tbe.format(max_group_width=30, max_group_depth=5))
+    assert output == "".join(tbe.format())
+    assert "... (max_group_depth is 1)\n" in output
+    assert "and 6 more exceptions\n" in output
+    assert "mid" not in output
+
+
+def test_formatting_limits_context() -> None:
+    from exceptiongroup import format_exception, formatting_limits
+
+    group = ExceptionGroup("test message", [ValueError(i) for i in range(4)])
+    with formatting_limits(max_group_width=3):
+        with formatting_limits(max_group_depth=5):
+            output = "".join(format_exception(group))
+            assert "and 1 more exception\n" in output
+
+        output = "".join(format_exception(group, max_group_width=1))
+        assert "and 3 more exceptions\n" in output
+
+    output = "".join(format_exception(group))
+    assert "more exception" not in output
+
+
+def test_formatting_limits_tasks() -> None:
+    import asyncio
+
+    from exceptiongroup import format_exception, formatting_limits
+
+    group = ExceptionGroup("test message", [ValueError(i) for i in range(4)])
+
+    async def format_group(width: int) -> str:
+        with formatting_limits(max_group_width=width):
+            await asyncio.sleep(0)
+            return "".join(format_exception(group))
+
+    async def main() -> List[str]:
+        return await asyncio.gather(format_group(1), format_group(2))
+
+    output1, output2 = asyncio.run(main())
+    assert "and 3 more exceptions\n" in output1
+    assert "and 2 more exceptions\n" in output2
+
+
+def test_format_exception_max_lines() -> None:
+    from exceptiongroup import format_exception, formatting_limits
+
+    try:
+        raise_excgroup()
+    except ExceptionGroup as exc:
+        group = exc
+
+    lines = "".join(format_exception(group)).splitlines()
+    assert "".join(format_exception(group, max_lines=len(lines))).splitlines() == lines
+
+    truncated = "".join(format_exception(group, max_lines=8)).splitlines()
+    assert len(truncated) <= 8
+    assert truncated[:-1] == lines[: len(truncated) - 1]
+    assert truncated[-1] == "... (output truncated, max_lines is 8)"
+
+    with formatting_limits(max_lines=8):
+        assert "".join(format_exception(group)).splitlines() == truncated
+
+
+def test_print_exception_limits(capsys: CaptureFixture) -> None:
+    from exceptiongroup import formatting_limits, print_exception
+
+    try:
+        raise ExceptionGroup("test message", [ValueError(i) for i in range(4)])
+    except ExceptionGroup as exc:
+        group = exc
+
+    print_exception(type(group), group, group.__traceback__, max_group_width=2)
+    output = capsys.readouterr().err
+    assert "raise ExceptionGroup(" in output
+    assert "and 2 more exceptions\n" in output
+
+    with formatting_limits(max_lines=3):
+        print_exception(group)
+
+    output = capsys.readouterr().err
+    assert output.splitlines()[-1] == "... (output truncated, max_lines is 3)"
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 11),
+    reason="No patching is done on Python >= 3.11",
+)
+def test_format_exception_collapse_identical_unhashable_group() -> None:
+    from exceptiongroup import format_exception
+
+    class UnhashableGroup(ExceptionGroup):
+        def __eq__(self, other: object) -> bool:
+            return self is other
+
+    group = ExceptionGroup(
+        "test message",
+        [UnhashableGroup("sub", [ValueError("same")]) for _ in range(2)],
+    )
+    output = "".join(format_exception(group, collapse_identical=True))
+    assert output.count("ValueError: same\n") == 2
+
+
+@pytest.mark.parametrize("max_lines", [0, -1])
+def test_formatting_limits_invalid_max_lines(max_lines: int) -> None:
+    from exceptiongroup import formatting_limits
+
+    with pytest.raises(ValueError, match="max_lines must be at least 1"):
+        with formatting_limits(max_lines=max_lines):
+            pass
+
+
+@pytest.mark.parametrize("max_lines", [0, -1])
+def test_format_exception_invalid_max_lines(max_lines: int) -> None:
+    from exceptiongroup import format_exception
+
+    with pytest.raises(ValueError, match="max_lines must be at least 1"):
+        format_exception(ValueError(), max_lines=max_lines)
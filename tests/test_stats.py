@@ -0,0 +1,108 @@
+import sys
+
+import pytest
+
+from exceptiongroup import (
+    ExceptionGroup,
+    catch,
+    disable_statistics,
+    enable_statistics,
+    get_statistics,
+    suppress,
+)
+
+
+@pytest.fixture
+def stats():
+    try:
+        yield enable_statistics()
+    finally:
+        disable_statistics()
+
+
+def test_disabled_by_default():
+    assert get_statistics() is None
+    with catch({ValueError: lambda eg: None}):
+        raise ValueError
+
+
+def test_enable_disable():
+    stats = enable_statistics()
+    try:
+        assert enable_statistics() is stats
+        assert get_statistics() is stats
+    finally:
+        disable_statistics()
+
+    assert get_statistics() is None
+
+
+def test_catch(stats):
+    def value_handler(eg):
+        pass
+
+    def key_handler(eg):
+        raise
+
+    with pytest.raises(ExceptionGroup):
+        with catch({ValueError: value_handler, KeyError: key_handler}):
+            raise ExceptionGroup(
+                "booboo",
+                [ValueError(), ExceptionGroup("nested", [KeyError(), ValueError()])],
+            )
+
+    with catch({ValueError: value_handler}):
+        raise ValueError
+
+    assert stats.exceptions == 2
+    assert stats.leaf_counts == {3: 1, 1: 1}
+    value_handler_name = f"{__name__}.test_catch.<locals>.value_handler"
+    key_handler_name = f"{__name__}.test_catch.<locals>.key_handler"
+    assert stats.handler_calls == {value_handler_name: 2, key_handler_name: 1}
+    assert stats.handler_time.keys() == {value_handler_name, key_handler_name}
+    assert stats.swallowed == {ValueError: 3}
+    assert stats.reraised == {KeyError: 1}
+
+
+def test_catch_handlers_by_name(stats):
+    def handle():
+        with catch({ValueError: lambda eg: None}):
+            raise ValueError
+
+    for _ in range(3):
+        handle()
+
+    name = f"{__name__}.test_catch_handlers_by_name.<locals>.handle.<locals>.<lambda>"
+    assert stats.handler_calls == {name: 3}
+
+
+def test_catch_no_match(stats):
+    with pytest.raises(ZeroDivisionError):
+        with catch({ValueError: lambda eg: None}):
+            raise ZeroDivisionError
+
+    assert stats.exceptions == 1
+    assert not stats.handler_calls
+    assert not stats.swallowed
+    assert stats.reraised == {ZeroDivisionError: 1}
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 12, 1), reason="suppress() comes from contextlib"
+)
+def test_suppress(stats):
+    with pytest.raises(ExceptionGroup):
+        with suppress(ValueError):
+            raise ExceptionGroup("booboo", [ValueError(), KeyError(), ValueError()])
+
+    with suppress(ValueError):
+        raise ValueError
+
+    with pytest.raises(KeyError):
+        with suppress(ValueError):
+            raise KeyError
+
+    assert stats.exceptions == 3
+    assert stats.leaf_counts == {3: 1, 1: 2}
+    assert stats.swallowed == {ValueError: 3}
+    assert stats.reraised == {KeyError: 2}
@@ -1,4 +1,5 @@
 import sys
+from abc import ABCMeta
 
 import pytest
 
@@ -14,3 +15,78 @@ def test_suppress_exception():
 
     assert len(exc.value.exceptions) == 1
     assert isinstance(exc.value.exceptions[0], RuntimeError)
+
+
+def test_suppress_whole_group():
+    suppressor = suppress(ValueError, KeyError)
+    for _ in range(2):
+        with suppressor:
+            raise ExceptionGroup(
+                "", [ValueError(), ExceptionGroup("", [KeyError(), ValueError()])]
+            )
+
+
+def test_suppress_nothing_in_group():
+    with pytest.raises(ExceptionGroup) as exc, suppress(KeyError):
+        group = ExceptionGroup("foo", [ValueError(), ExceptionGroup("", [TypeError()])])
+        raise group
+
+    assert exc.value is not group
+    assert str(exc.value) == "foo (2 sub-exceptions)"
+    # contextlib.suppress() on Python 3.12.1+ re-derives the nested group
+    value_error, nested = exc.value.exceptions
+    assert value_error is group.exceptions[0]
+    assert isinstance(nested, ExceptionGroup)
+    assert str(nested) == " (1 sub-exception)"
+    assert nested.exceptions == group.exceptions[1].exceptions
+
+
+def test_suppress_nested_group_subclass():
+    class SuppressedGroup(ExceptionGroup, RuntimeError):
+        pass
+
+    with suppress(RuntimeError):
+        raise ExceptionGroup("", [SuppressedGroup("", [ValueError()])])
+
+
+def test_suppress_reuse():
+    suppressor = suppress(ValueError)
+    for _ in range(3):
+        with suppressor:
+            raise ValueError
+
+        with pytest.raises(KeyError), suppressor:
+            raise KeyError
+
+
+def test_suppress_abc_registered_type():
+    class RegisteredError(Exception, metaclass=ABCMeta):
+        pass
+
+    RegisteredError.register(ValueError)
+
+    # Naked exceptions are matched with issubclass()...
+    with suppress(RegisteredError):
+        raise ValueError
+
+    # ...but exceptions in groups by their MRO, like with split()
+    with pytest.raises(ExceptionGroup) as exc, suppress(RegisteredError):
+        raise ExceptionGroup("", [ValueError()])
+
+    assert len(exc.value.exceptions) == 1
+    assert isinstance(exc.value.exceptions[0], ValueError)
+
+
+def test_suppress_group_non_exception_type():
+    class NonException(metaclass=ABCMeta):
+        pass
+
+    with pytest.raises(TypeError), suppress(NonException):
+        raise ExceptionGroup("", [ValueError()])
+
+
+def test_suppress_nothing_in_group_derive_gets_list(sorting_group):
+    with pytest.raises(sorting_group) as exc, suppress(KeyError):
+        raise sorting_group("", [ValueError("b"), ValueError("a")])
+
+    assert [str(e) for e in exc.value.exceptions] == ["a", "b"]
@@ -0,0 +1,278 @@
+import pytest
+
+from exceptiongroup import (
+    BaseExceptionGroup,
+    ExceptionGroup,
+    batch_split,
+    contains_leaf,
+    count_leaves,
+    find_leaf,
+    iter_leaves,
+    leaf_only,
+    partition,
+)
+
+
+@pytest.fixture
+def nested_group():
+    return BaseExceptionGroup(
+        "root",
+        [
+            ValueError(1),
+            ExceptionGroup(
+                "nested", [KeyError(2), ExceptionGroup("nested2", [ValueError(3)])]
+            ),
+            KeyboardInterrupt(),
+        ],
+    )
+
+
+def test_partition():
+    group = ExceptionGroup(
+        "root",
+        [
+            ValueError(1),
+            ExceptionGroup("nested", [KeyError(2), RuntimeError(3)]),
+            KeyError(4),
+            TypeError(5),
+        ],
+    )
+    value_errors, key_errors, rest = partition(group, [ValueError, (KeyError,)])
+    assert value_errors.message == "root"
+    assert [type(exc) for exc in value_errors.exceptions] == [ValueError]
+    assert key_errors.exceptions[0].message == "nested"
+    assert key_errors.exceptions[0].exceptions == (group.exceptions[1].exceptions[0],)
+    assert key_errors.exceptions[1] is group.exceptions[2]
+    assert rest.exceptions[0].exceptions == (group.exceptions[1].exceptions[1],)
+    assert rest.exceptions[1] is group.exceptions[3]
+
+
+def test_partition_matches_sequential_split():
+    group = BaseExceptionGroup(
+        "root",
+        [
+            ValueError(1),
+            BaseExceptionGroup("nested", [KeyboardInterrupt(), ValueError(2)]),
+            ExceptionGroup("nested2", [KeyError(3), OSError(4)]),
+        ],
+    )
+    conditions = [ValueError, Exception, lambda exc: True]
+    parts = partition(group, conditions)
+    rest = group
+    for condition, part in zip(conditions, parts):
+        matched, rest = rest.split(condition)
+        assert repr(part) == repr(matched)
+
+    assert parts[-1] is None
+
+
+def test_partition_reuses_untouched_groups():
+    nested = ExceptionGroup("nested", [KeyError(2), KeyError(3)])
+    group = ExceptionGroup("root", [ValueError(1), nested])
+    value_errors, key_errors, rest = partition(group, [ValueError, KeyError])
+    assert key_errors.exceptions == (nested,)
+    assert rest is None
+
+
+def test_partition_group_matches_first_condition():
+    group = ExceptionGroup("root", [ValueError(1)])
+    assert partition(group, [ExceptionGroup, ValueError]) == [group, None, None]
+
+
+def test_partition_copies_attributes():
+    group = ExceptionGroup("root", [ValueError(1), KeyError(2)])
+    group.__cause__ = RuntimeError("cause")
+    group.add_note("note")
+    value_errors, rest = partition(group, [ValueError])
+    for part in (value_errors, rest):
+        assert part.__cause__ is group.__cause__
+        assert part.__notes__ == ["note"]
+        assert part.__notes__ is not group.__notes__
+
+
+def test_iter_leaves(nested_group):
+    leaves = list(iter_leaves(nested_group))
+    assert leaves == [
+        ((0,), nested_group.exceptions[0]),
+        ((1, 0), nested_group.exceptions[1].exceptions[0]),
+        ((1, 1, 0), nested_group.exceptions[1].exceptions[1].exceptions[0]),
+        ((2,), nested_group.exceptions[2]),
+    ]
+    for path, exc in leaves:
+        node = nested_group
+        for index in path:
+            node = node.exceptions[index]
+
+        assert node is exc
+
+
+def test_iter_leaves_deep():
+    group = ExceptionGroup("leaf", [ValueError()])
+    for _ in range(5000):
+        group = ExceptionGroup("eg", [group])
+
+    ((path, exc),) = iter_leaves(group)
+    assert path == (0,) * 5001
+    assert isinstance(exc, ValueError)
+
+
+def test_contains_leaf(nested_group):
+    assert contains_leaf(nested_group, KeyError)
+    assert contains_leaf(nested_group, (OSError, KeyboardInterrupt))
+    assert not contains_leaf(nested_group, OSError)
+    assert not contains_leaf(nested_group, ExceptionGroup)
+
+
+def test_count_leaves(nested_group):
+    assert count_leaves(nested_group) == 4
+    assert count_leaves(nested_group, ValueError) == 2
+    assert count_leaves(nested_group, lambda exc: isinstance(exc, Exception)) == 3
+
+
+def test_find_leaf(nested_group):
+    assert find_leaf(nested_group, KeyError) is nested_group.exceptions[1].exceptions[0]
+    assert find_leaf(nested_group, ValueError) is nested_group.exceptions[0]
+    assert (
+        find_leaf(nested_group, lambda exc: exc.args == (3,))
+        is (nested_group.exceptions[1].exceptions[1].exceptions[0])
+    )
+    assert find_leaf(nested_group, OSError) is None
+
+
+def test_leaf_only_split(nested_group):
+    def predicate(exc):
+        seen.append(exc)
+        return isinstance(exc, ValueError)
+
+    seen = []
+    match, rest = nested_group.split(leaf_only(predicate))
+    assert not any(isinstance(exc, BaseExceptionGroup) for exc in seen)
+    assert len(seen) == 4
+    assert [exc for _, exc in iter_leaves(match)] == [
+        nested_group.exceptions[0],
+        nested_group.exceptions[1].exceptions[1].exceptions[0],
+    ]
+    assert [exc for _, exc in iter_leaves(rest)] == [
+        nested_group.exceptions[1].exceptions[0],
+        nested_group.exceptions[2],
+    ]
+
+    seen.clear()
+    subgroup = nested_group.subgroup(leaf_only(predicate))
+    assert len(seen) == 4
+    assert [exc for _, exc in iter_leaves(subgroup)] == [
+        exc for _, exc in iter_leaves(match)
+    ]
+
+
+def test_leaf_only_partition(nested_group):
+    value_errors, rest = partition(
+        nested_group, [leaf_only(lambda exc: isinstance(exc, ValueError))]
+    )
+    assert count_leaves(value_errors) == 2
+    assert count_leaves(rest) == 2
+
+
+def test_leaf_only_group_subclass():
+    class MatchingGroup(ExceptionGroup, ValueError):
+        pass
+
+    group = ExceptionGroup("root", [MatchingGroup("nested", [KeyError()])])
+    assert group.subgroup(leaf_only(lambda exc: isinstance(exc, ValueError))) is None
+
+
+@pytest.mark.parametrize(
+    "condition",
+    [pytest.param(ValueError, id="type"), pytest.param((ValueError,), id="tuple")],
+)
+def test_leaf_only_exception_types(nested_group, condition):
+    match, rest = nested_group.split(leaf_only(condition))
+    assert [exc for _, exc in iter_leaves(match)] == [
+        nested_group.exceptions[0],
+        nested_group.exceptions[1].exceptions[1].exceptions[0],
+    ]
+    assert count_leaves(rest) == 2
+
+
+def test_leaf_only_invalid_tuple():
+    with pytest.raises(TypeError):
+        leaf_only((ValueError, 1))
+
+
+def test_leaf_only_not_callable():
+    with pytest.raises(TypeError, match="the predicate must be callable"):
+        leaf_only(1)
+
+
+def test_batch_split(nested_group):
+    def predicate(leaves):
+        calls.append(leaves)
+        return [isinstance(exc, ValueError) for exc in leaves]
+
+    calls = []
+    match, rest = batch_split(nested_group, predicate)
+    assert calls == [[exc for _, exc in iter_leaves(nested_group)]]
+    assert match.message == rest.message == "root"
+    assert [exc for _, exc in iter_leaves(match)] == [
+        nested_group.exceptions[0],
+        nested_group.exceptions[1].exceptions[1].exceptions[0],
+    ]
+    assert [exc for _, exc in iter_leaves(rest)] == [
+        nested_group.exceptions[1].exceptions[0],
+        nested_group.exceptions[2],
+    ]
+
+    # The innermost group only contains a match, so it should have been reused
+    assert (
+        match.exceptions[1].exceptions[0] is (nested_group.exceptions[1].exceptions[1])
+    )
+
+
+def test_batch_split_one_sided(nested_group):
+    match, rest = batch_split(nested_group, lambda leaves: [1] * len(leaves))
+    assert rest is None
+    assert match is not nested_group
+    assert match.exceptions == nested_group.exceptions
+
+    match, rest = batch_split(nested_group, lambda leaves: (0,) * len(leaves))
+    assert match is None
+    assert rest.exceptions == nested_group.exceptions
+
+
+def test_batch_split_one_sided_derive_gets_list(sorting_group):
+    group = sorting_group("root", [ValueError("b"), ValueError("a")])
+    match, rest = batch_split(group, lambda leaves: [True] * len(leaves))
+    assert rest is None
+    assert [str(exc) for exc in match.exceptions] == ["a", "b"]
+    assert repr(match) == repr(group.split(leaf_only(lambda exc: True))[0])
+
+
+def test_batch_split_flat():
+    group = ExceptionGroup("flat", [ValueError(1), KeyError(2), ValueError(3)])
+    group.add_note("note")
+    match, rest = batch_split(
+        group, lambda leaves: [isinstance(exc, ValueError) for exc in leaves]
+    )
+    assert match.exceptions == (group.exceptions[0], group.exceptions[2])
+    assert rest.exceptions == (group.exceptions[1],)
+    assert match.__notes__ == rest.__notes__ == ["note"]
+
+
+def test_batch_split_wrong_length(nested_group):
+    with pytest.raises(
+        ValueError, match="the predicate returned 3 items for 4 exceptions"
+    ):
+        batch_split(nested_group, lambda leaves: [True] * 3)
+
+
+def test_batch_split_numpy(nested_group):
+    numpy = pytest.importorskip("numpy")
+
+    def predicate(leaves):
+        return numpy.array([isinstance(exc, KeyError) for exc in leaves])
+
+    match, rest = batch_split(nested_group, predicate)
+    assert [exc for _, exc in iter_leaves(match)] == [
+        nested_group.exceptions[1].exceptions[0]
+    ]
+    assert count_leaves(rest) == 3